@@ -4,8 +4,11 @@ from datetime import date
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
 
-# Add the src directory to the system path
-sys.path.insert(0, os.path.abspath("../../src"))
+# Add the src directory to the system path. Resolve it from this file (not the
+# cwd) and only insert once: conf.py is re-executed on parallel worker start-up.
+_src = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+if _src not in sys.path:
+    sys.path.insert(0, _src)
 
 # Build fsr_playbooks' pydantic models NOW, before sphinx reads any document.
 #
@@ -64,6 +67,12 @@ extensions = [
     "sphinx_copybutton",  # one-click copy on code blocks
 ]
 
+# PYFSR_DOCS_PROFILE=1 adds sphinx.ext.duration, which prints the slowest
+# documents to read at the end of the build. Off by default: it's a diagnostic
+# for finding where build time goes, not something published builds need.
+if os.environ.get("PYFSR_DOCS_PROFILE"):
+    extensions.append("sphinx.ext.duration")
+
 # Suppress the Python-domain "more than one target found for cross-reference"
 # ambiguity only (Sphinx emits it as ``type='ref', subtype='python'``). This
 # fires when two attributes share a name that also appears as a bare builtin
@@ -83,6 +92,11 @@ if _skip_autoapi:
 # Author guides in Markdown; keep .rst working for the AutoAPI output.
 source_suffix = {".rst": "restructuredtext", ".md": "markdown"}
 
+# Skip docutils' SmartQuotes transform: it walks every text node of every page
+# on read, and this is a code-heavy API reference where curly quotes add
+# nothing (and are wrong inside inline literals copied from prose).
+smartquotes = False
+
 # MyST niceties: colon-fences (for sphinx-design directives) and smart links.
 myst_enable_extensions = ["colon_fence", "deflist"]
 myst_heading_anchors = 3
@@ -272,8 +286,6 @@ autoapi_options = [
 # -- HTML output -------------------------------------------------------------
 html_theme = "furo"
 templates_path = ["_templates"]
-html_static_path = ["_static"]
-html_css_files = ["custom.css"]
 
 html_title = f"pyfsr {version}"
 
@@ -27,8 +27,12 @@ def setup_docs():
 
 
 def build_docs():
-    """Build documentation using sphinx-build"""
-    os.system("sphinx-build -b html docs/source docs/build/html")
+    """Build documentation through docs/Makefile.
+
+    Going through ``make html`` picks up the parallel build and the persistent
+    doctree cache, so a rebuild only re-reads the pages that changed.
+    """
+    os.system("make -C docs html")
 
 
 def clean_docs():
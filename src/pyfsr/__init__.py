@@ -4,65 +4,166 @@ PyFSR: Python client for the FortiSOAR REST API.
 For detailed documentation, visit: https://ftnt-dspille.github.io/pyfsr/
 """
 
-from . import content_catalog, repo
-from .api.ai import pack_agent
-from .api.connectors import ConnectorPackageError, pack_connector, validate_connector_source
-from .api.export_config import ExportTemplate
-from .appliance import Appliance
-from .client import FortiSOAR
-from .concurrency import ConcurrencyResult, compute_overlap
-from .config import EnvConfig
-from .exports import Export, ExportError, ExportKind, ExportValidationError, Finding
-from .jinja_validate import FSR_JINJA_FILTERS, JinjaIssue, validate_jinja_expressions
-from .models import (
-    MODEL_REGISTRY,
-    Alert,
-    ApiResult,
-    BaseRecord,
-    Comment,
-    ConfigValidationResult,
-    ConnectorConfig,
-    ConnectorConfigSummary,
-    ConnectorOperation,
-    ConnectorVersionInfo,
-    ContentHubConnector,
-    ContentHubItem,
-    EnsureVersionResult,
-    ExecuteResult,
-    ExportJobResult,
-    FeaturedTag,
-    HealthcheckResult,
-    ImportJob,
-    ImportJobResult,
-    Incident,
-    InstalledConnector,
-    InstallJobStatus,
-    ModulePermission,
-    PicklistIRI,
-    RecordIRI,
-    RepoConnectorEntry,
-    RunEnv,
-    RunFailure,
-    RunStep,
-    RunSummary,
-    SolutionPack,
-    SolutionPackInfo,
-    SolutionPackInstallResponse,
-    Task,
-    TriggerResponse,
-    Widget,
-    WidgetInfo,
-    WidgetRecord,
-    Workflow,
-    WorkflowCollection,
-    WorkflowRun,
-    model_for,
-)
-from .pagination import HydraPage, paginate
-from .projection import SUMMARY_FIELDS, iri_to_uuid, project, project_record, to_jsonable
-from .query import Query
-from .query_models import OPERATOR_SPECS, QueryBody
-from .records import BulkUpsertFailure, BulkUpsertResult, RecordSet
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import content_catalog, repo
+    from .api.ai import pack_agent
+    from .api.connectors import ConnectorPackageError, pack_connector, validate_connector_source
+    from .api.export_config import ExportTemplate
+    from .appliance import Appliance
+    from .client import FortiSOAR
+    from .concurrency import ConcurrencyResult, compute_overlap
+    from .config import EnvConfig
+    from .exports import Export, ExportError, ExportKind, ExportValidationError, Finding
+    from .jinja_validate import FSR_JINJA_FILTERS, JinjaIssue, validate_jinja_expressions
+    from .models import (
+        MODEL_REGISTRY,
+        Alert,
+        ApiResult,
+        BaseRecord,
+        Comment,
+        ConfigValidationResult,
+        ConnectorConfig,
+        ConnectorConfigSummary,
+        ConnectorOperation,
+        ConnectorVersionInfo,
+        ContentHubConnector,
+        ContentHubItem,
+        EnsureVersionResult,
+        ExecuteResult,
+        ExportJobResult,
+        FeaturedTag,
+        HealthcheckResult,
+        ImportJob,
+        ImportJobResult,
+        Incident,
+        InstalledConnector,
+        InstallJobStatus,
+        ModulePermission,
+        PicklistIRI,
+        RecordIRI,
+        RepoConnectorEntry,
+        RunEnv,
+        RunFailure,
+        RunStep,
+        RunSummary,
+        SolutionPack,
+        SolutionPackInfo,
+        SolutionPackInstallResponse,
+        Task,
+        TriggerResponse,
+        Widget,
+        WidgetInfo,
+        WidgetRecord,
+        Workflow,
+        WorkflowCollection,
+        WorkflowRun,
+        model_for,
+    )
+    from .pagination import HydraPage, paginate
+    from .projection import SUMMARY_FIELDS, iri_to_uuid, project, project_record, to_jsonable
+    from .query import Query
+    from .query_models import OPERATOR_SPECS, QueryBody
+    from .records import BulkUpsertFailure, BulkUpsertResult, RecordSet
+
+# Public names are resolved on first access (PEP 562) rather than at import:
+# eagerly pulling in the client, every API wrapper and the pydantic models made
+# a bare ``import pyfsr`` cost ~0.6s, which the CLI and ``pyfsr.__version__``
+# readers paid even when they never touched them.
+_LAZY_ATTRS: dict[str, str] = {
+    "content_catalog": ".content_catalog",
+    "repo": ".repo",
+    "pack_agent": ".api.ai",
+    "ConnectorPackageError": ".api.connectors",
+    "pack_connector": ".api.connectors",
+    "validate_connector_source": ".api.connectors",
+    "ExportTemplate": ".api.export_config",
+    "Appliance": ".appliance",
+    "FortiSOAR": ".client",
+    "ConcurrencyResult": ".concurrency",
+    "compute_overlap": ".concurrency",
+    "EnvConfig": ".config",
+    "Export": ".exports",
+    "ExportError": ".exports",
+    "ExportKind": ".exports",
+    "ExportValidationError": ".exports",
+    "Finding": ".exports",
+    "FSR_JINJA_FILTERS": ".jinja_validate",
+    "JinjaIssue": ".jinja_validate",
+    "validate_jinja_expressions": ".jinja_validate",
+    "MODEL_REGISTRY": ".models",
+    "Alert": ".models",
+    "ApiResult": ".models",
+    "BaseRecord": ".models",
+    "Comment": ".models",
+    "ConfigValidationResult": ".models",
+    "ConnectorConfig": ".models",
+    "ConnectorConfigSummary": ".models",
+    "ConnectorOperation": ".models",
+    "ConnectorVersionInfo": ".models",
+    "ContentHubConnector": ".models",
+    "ContentHubItem": ".models",
+    "EnsureVersionResult": ".models",
+    "ExecuteResult": ".models",
+    "ExportJobResult": ".models",
+    "FeaturedTag": ".models",
+    "HealthcheckResult": ".models",
+    "ImportJob": ".models",
+    "ImportJobResult": ".models",
+    "Incident": ".models",
+    "InstalledConnector": ".models",
+    "InstallJobStatus": ".models",
+    "ModulePermission": ".models",
+    "PicklistIRI": ".models",
+    "RecordIRI": ".models",
+    "RepoConnectorEntry": ".models",
+    "RunEnv": ".models",
+    "RunFailure": ".models",
+    "RunStep": ".models",
+    "RunSummary": ".models",
+    "SolutionPack": ".models",
+    "SolutionPackInfo": ".models",
+    "SolutionPackInstallResponse": ".models",
+    "Task": ".models",
+    "TriggerResponse": ".models",
+    "Widget": ".models",
+    "WidgetInfo": ".models",
+    "WidgetRecord": ".models",
+    "Workflow": ".models",
+    "WorkflowCollection": ".models",
+    "WorkflowRun": ".models",
+    "model_for": ".models",
+    "HydraPage": ".pagination",
+    "paginate": ".pagination",
+    "SUMMARY_FIELDS": ".projection",
+    "iri_to_uuid": ".projection",
+    "project": ".projection",
+    "project_record": ".projection",
+    "to_jsonable": ".projection",
+    "Query": ".query",
+    "OPERATOR_SPECS": ".query_models",
+    "QueryBody": ".query_models",
+    "BulkUpsertFailure": ".records",
+    "BulkUpsertResult": ".records",
+    "RecordSet": ".records",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    value = module if module_path == f".{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 try:
     # Generated by hatch-vcs at build time from the latest git tag.
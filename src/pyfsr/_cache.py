@@ -0,0 +1,74 @@
+"""Shared bounded, expiring memo for name -> value lookups.
+
+Several wrappers resolve human names (picklists, connectors, templates, content
+hub packs) to server-side identifiers, one request per miss. Those answers
+rarely change during a run but *can* (a template re-created under the same
+name, a pack installed), so they are cached for a fixed ``ttl`` rather than for
+the client's lifetime, and the least recently used entry is evicted past
+``maxsize``.
+
+``functools.lru_cache`` is deliberately not used on the methods themselves: it
+keys on ``self``, pins the client for the cache's lifetime, and never expires.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Bounded LRU memo whose entries expire ``ttl`` seconds after being stored.
+
+    Safe to share across the :func:`~pyfsr._concurrency.map_threaded` workers.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def digest_key(*parts: str) -> str:
+    """Stable cache key for secret-bearing inputs (credentials, API keys).
+
+    Module-level caches keyed on credentials hold this SHA-256 digest rather
+    than the secret itself.
+    """
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
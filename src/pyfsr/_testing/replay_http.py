@@ -416,6 +416,9 @@ def _build_response(fixture: dict, url: str) -> Response:
     else:
         raw = json.dumps(body).encode()
     resp._content = raw
+    # The body is fully loaded, so mark it consumed: a ``stream=True`` caller's
+    # ``iter_content()`` then slices ``_content`` instead of reading a raw socket.
+    resp._content_consumed = True
     resp.encoding = "utf-8"
     return resp
 
@@ -643,7 +646,7 @@ def demo_client(
     shared fixture table.
 
     Construction uses **token auth**: ``APIKeyAuth.__init__`` validates the key
-    with a live ``GET /api/3/people``, so ``demo_client`` briefly neutralises
+    with a live probe of ``/api/3/people``, so ``demo_client`` briefly neutralises
     that one validation call (it would otherwise hit the network before the
     replay session is installed). The neutralisation is scoped to construction
     only; once the replay session is swapped in, every subsequent call —
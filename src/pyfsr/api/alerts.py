@@ -7,6 +7,8 @@ dicts rather than typed models — see :doc:`/guides/records` for the
 dict-vs-model distinction and when to reach for each.
 """
 
+from __future__ import annotations
+
 from typing import Any
 
 from .base import BaseAPI
@@ -124,6 +126,38 @@ class AlertsAPI(BaseAPI):
 
         return self.client.get(f"/api/3/{self.module}/{alert_id}")
 
+    def get_many(
+        self,
+        alert_ids: list[str] | tuple[str, ...],
+        *,
+        max_workers: int = 8,
+        on_error: str = "none",
+    ) -> list[dict[str, Any] | None]:
+        """
+        Get many alerts by ID **concurrently**, results ordered like ``alert_ids``.
+
+        Each ID is fetched with :meth:`get` in a bounded thread pool, so N
+        independent ``GET`` requests cost roughly one round-trip instead of N.
+
+        Args:
+            alert_ids: The unique identifiers of the alerts to fetch
+            max_workers: Thread ceiling for the fan-out. Defaults to 8.
+            on_error: ``"none"`` (default) puts ``None`` in the slot of any alert
+                whose fetch fails (e.g. a 404) and keeps the rest; ``"raise"``
+                lets the first failure propagate.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The alert objects, in input order
+
+        Example:
+            .. code-block:: python
+
+                alerts = client.alerts.get_many(["alert-123", "alert-456"])
+        """
+        from .._concurrency import map_threaded
+
+        return map_threaded(self.get, list(alert_ids), max_workers=max_workers, on_error=on_error)
+
     def update(self, alert_id: str, data: dict[str, Any], *, resolve_picklists: bool = True) -> dict[str, Any]:
         """
         Update an existing alert.
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 import requests
 
+from .._cache import TTLCache
 from ..pagination import extract_members
 from .base import BaseAPI
 
@@ -38,6 +39,11 @@ _REPO_BASE = f"{_REPO_HOST}/content-hub"
 #: match entirely.
 _ALL_AI_AGENTS = 2147483647
 
+#: How long a solution-pack search result is reused by a ``use_cache=True``
+#: lookup. Short: it only has to cover a script resolving the same packs back
+#: to back.
+_PACK_SEARCH_TTL = 60.0
+
 
 class ContentType(Enum):
     """Types of content that can be searched for in FortiSOAR Content Hub"""
@@ -70,8 +76,24 @@ class ContentHubSearch(BaseAPI):
     / ``ContentHubConnector`` / ``Widget``). Those models subclass
     ``BaseRecord`` and stay dict-compatible (``item["label"]`` / ``item.get(...)``
     work alongside ``item.label``), so the typed view loses nothing.
+
+    Solution-pack searches can opt into a one-minute memo per ``(installed,
+    search_term, limit)`` with ``use_cache=True``, so a script resolving the same
+    pack repeatedly pays one POST (``client.solution_packs`` export and
+    uninstall resolve packs this way). Plain calls always ask the appliance, so
+    polling sees installs as they land. :meth:`clear_cache` drops the memo
+    (installing or removing a pack through ``client.solution_packs`` does so
+    automatically, again once an awaited install finishes).
     """
 
+    def __init__(self, client):
+        super().__init__(client)
+        self._pack_search_cache = TTLCache(ttl=_PACK_SEARCH_TTL)
+
+    def clear_cache(self) -> None:
+        """Forget memoized solution-pack search results."""
+        self._pack_search_cache.clear()
+
     def _search_content(
         self,
         content_type: ContentType,
@@ -80,6 +102,7 @@ class ContentHubSearch(BaseAPI):
         limit: int = 30,
         extra_filters: list[dict[str, Any]] | None = None,
         extra_fields: list[str] | None = None,
+        use_cache: bool = False,
     ) -> list[ContentHubItem]:
         """
         Generic search method for Content Hub items.
@@ -91,11 +114,19 @@ class ContentHubSearch(BaseAPI):
             limit: Maximum number of results to return
             extra_filters: Additional filters to apply to the query
             extra_fields: Additional fields to include in the response
+            use_cache: Serve/store a solution-pack search through the memo
 
         Returns:
             The matching content items as typed, dict-compatible models
             (``SolutionPack`` / ``ContentHubConnector`` / ``Widget``).
         """
+        cache_key = None
+        if use_cache and content_type is ContentType.SOLUTION_PACK and not extra_filters and not extra_fields:
+            cache_key = (installed, search_term, limit)
+            members = self._pack_search_cache.get(cache_key)
+            if members is not None:
+                return [_model_for_type(content_type)(**m) for m in members]
+
         query = {
             "sort": [
                 {"field": "featured", "direction": "DESC"},
@@ -141,10 +172,13 @@ class ContentHubSearch(BaseAPI):
             fields.extend(extra_fields)
         query["__selectFields"] = fields
 
-        response = self.client.post(
-            f"/api/query/solutionpacks?$limit={limit}&$page=1&$search={search_term}", data=query
-        )
+        # The body's ``search``/``limit`` are what the query endpoint filters on;
+        # only paging goes on the URL, encoded by the client rather than
+        # interpolated (a term containing ``&`` or ``#`` used to truncate it).
+        response = self.client.post("/api/query/solutionpacks", data=query, params={"$limit": limit, "$page": 1})
         members = extract_members(response)
+        if cache_key is not None:
+            self._pack_search_cache.put(cache_key, members)
         model = _model_for_type(content_type)
         return [model(**m) for m in members]
 
@@ -153,6 +187,7 @@ class ContentHubSearch(BaseAPI):
         content_type: ContentType,
         search_term: str,
         installed: bool = True,
+        use_cache: bool = False,
     ) -> ContentHubItem | None:
         """Find a single content item matching the search criteria."""
         results = self._search_content(
@@ -160,33 +195,39 @@ class ContentHubSearch(BaseAPI):
             installed=installed,
             search_term=search_term,
             limit=1,
+            use_cache=use_cache,
         )
         return results[0] if results else None
 
     # Solution Pack Methods
-    def find_installed_pack(self, search_term: str) -> SolutionPack | None:
+    def find_installed_pack(self, search_term: str, *, use_cache: bool = False) -> SolutionPack | None:
         """Find a single installed solution pack by name, label, or description.
 
-        Returns a dict-compatible ``SolutionPack`` (or ``None``).
+        Returns a dict-compatible ``SolutionPack`` (or ``None``). ``use_cache=True``
+        reuses an identical search from the last minute.
 
         Example:
             .. code-block:: python
 
                 pack = content_hub.find_installed_pack("SOAR Framework")
         """
-        return self._find_single_content(ContentType.SOLUTION_PACK, search_term, installed=True)
+        return self._find_single_content(ContentType.SOLUTION_PACK, search_term, installed=True, use_cache=use_cache)
 
-    def find_available_pack(self, search_term: str = "") -> SolutionPack | None:
+    def find_available_pack(self, search_term: str = "", *, use_cache: bool = False) -> SolutionPack | None:
         """Find a single available solution pack by name, label, or description.
 
-        Returns a dict-compatible ``SolutionPack`` (or ``None``).
+        Returns a dict-compatible ``SolutionPack`` (or ``None``). ``use_cache=True``
+        reuses an identical search from the last minute.
         """
-        return self._find_single_content(ContentType.SOLUTION_PACK, search_term, installed=False)
+        return self._find_single_content(ContentType.SOLUTION_PACK, search_term, installed=False, use_cache=use_cache)
 
-    def search_installed_packs(self, search_term: str = "", limit: int = 30) -> list[SolutionPack]:
+    def search_installed_packs(
+        self, search_term: str = "", limit: int = 30, *, use_cache: bool = False
+    ) -> list[SolutionPack]:
         """Search for all installed solution packs matching the search criteria.
 
-        Returns dict-compatible ``SolutionPack`` objects.
+        Returns dict-compatible ``SolutionPack`` objects. ``use_cache=True`` reuses
+        an identical search from the last minute.
 
         Example:
             .. code-block:: python
@@ -198,18 +239,23 @@ class ContentHubSearch(BaseAPI):
             installed=True,
             search_term=search_term,
             limit=limit,
+            use_cache=use_cache,
         )
 
-    def search_available_packs(self, search_term: str = "", limit: int = 30) -> list[SolutionPack]:
+    def search_available_packs(
+        self, search_term: str = "", limit: int = 30, *, use_cache: bool = False
+    ) -> list[SolutionPack]:
         """Search for all available solution packs matching the search criteria.
 
-        Returns dict-compatible ``SolutionPack`` objects.
+        Returns dict-compatible ``SolutionPack`` objects. ``use_cache=True`` reuses
+        an identical search from the last minute.
         """
         return self._search_content(
             ContentType.SOLUTION_PACK,
             installed=False,
             search_term=search_term,
             limit=limit,
+            use_cache=use_cache,
         )
 
     # Connector Methods
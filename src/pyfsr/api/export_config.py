@@ -7,10 +7,15 @@ the active auth method; the API checks support before running.
 """
 
 import os
+import re
 import time
+from collections.abc import Iterable, Mapping
 from typing import Any
 
+from .._cache import TTLCache
+from .._concurrency import map_threaded
 from ..auth.base import BaseAuth
+from ..exceptions import FortiSOARException, ResourceNotFoundError
 from ..models._export import (
     ActorSelection,
     AiAgentSelection,
@@ -41,6 +46,46 @@ __all__ = ["ExportConfigAPI", "ExportTemplate", "SolutionPackBuilder"]
 # "unlimited"; callers raise this via ``add_record_set(limit=...)`` when needed.
 _DEFAULT_RECORD_LIMIT = 1000
 
+# ``$limit`` for the one-shot name-index reads (picklist names, playbook
+# collections): the server's max page size, so the whole index is one page.
+_INDEX_LIMIT = 2147483647
+
+# Chunk size for streaming an export archive to disk.
+_DOWNLOAD_CHUNK = 1 << 20
+
+# Option sections create_simplified_template always sends empty. Only the names
+# are shared: each template gets fresh lists, since the options dict is the
+# POST body and must not alias another template's.
+_SIMPLIFIED_EMPTY_SECTIONS = (
+    "recordSets",
+    "views",
+    "reports",
+    "dashboards",
+    "roles",
+    "teams",
+    "actors",
+    "widgets",
+    "appSettings",
+    "showOnlyConfigured",
+    "preprocessingRules",
+    "ruleChannels",
+    "rules",
+)
+
+# Template name -> export filename: separators and whitespace become ``_`` in
+# one pass, plus ``&``/``#``/``?``, which would otherwise end the ``fileName``
+# query parameter of the export trigger URL early.
+_FILENAME_TRANS = str.maketrans(dict.fromkeys(" \t\r\n/\\:&#?", "_"))
+
+# Export-job polling: the gap between status checks starts at the caller's
+# ``poll_interval`` and grows by this factor up to the ceiling, so a long export
+# costs a handful of requests rather than one every few seconds.
+_EXPORT_POLL_BACKOFF = 1.5
+_EXPORT_POLL_CEILING = 60.0
+
+# Export-job statuses (lower-cased) that mean the job ended without an archive.
+_EXPORT_FAILED = frozenset({"export failed", "failed", "error", "cancelled", "canceled"})
+
 # The export wizard's fixed set of application-setting sections (APP_SETTINGS in
 # the 8.0 editor bundle); options.appSettings is a bare list of these names.
 _APP_SETTING_NAMES = frozenset({"systemSettings", "LDAP", "RADIUS", "TOKEN", "HA", "sso", "syslog", "proxy"})
@@ -495,8 +540,6 @@ def _slugify_pack_name(label: str) -> str:
     Mirrors the wizard's default: lower-case, non-alphanumerics collapsed to
     single hyphens (e.g. ``"My SOC Pack"`` -> ``"my-soc-pack"``).
     """
-    import re
-
     slug = re.sub(r"[^a-z0-9]+", "-", label.strip().lower()).strip("-")
     return slug or "solution-pack"
 
@@ -606,27 +649,161 @@ class SolutionPackBuilder(ExportTemplate):
         return ic
 
 
+def _connector_export_info(connector: Mapping[str, Any]) -> dict[str, Any]:
+    """Content Hub connector row -> the ``connectors`` entry of export options."""
+    return {
+        "value": f"cyops-connector-{connector['name']}-{connector['version']}",
+        "version": connector["version"],
+        "label": connector["label"],
+    }
+
+
+def _collection_export_info(collection: Mapping[str, Any]) -> dict[str, Any]:
+    """``workflow_collections`` row -> a ``playbooks.collections`` label/value entry."""
+    return {"label": collection["name"], "value": collection["@id"].split("/")[-1]}
+
+
 class ExportConfigAPI(BaseAPI):
     """Class to handle FortiSOAR export configuration operations"""
 
     def __init__(self, client):
         super().__init__(client)
         self.content_hub = ContentHubSearch(client)
+        # name -> resolved value for each lookup category. Every miss is at
+        # least one request, so repeat names within the TTL cost nothing.
+        self._picklist_cache = TTLCache()
+        self._connector_cache = TTLCache()
+        self._collection_cache = TTLCache()
+        self._template_cache = TTLCache()
+        # (endpoint, params) -> (ETag, rows) of the last name read, revalidated
+        # with If-None-Match rather than re-downloaded. Bounded like the name
+        # caches; revalidation keeps an old entry correct, so the TTL is long.
+        self._index_etags = TTLCache(ttl=3600.0)
+
+    def clear_cache(self) -> None:
+        """Drop the cached picklist / connector / collection / template lookups."""
+        for cache in (self._picklist_cache, self._connector_cache, self._collection_cache, self._template_cache):
+            cache.clear()
+        self._index_etags.clear()
+
+    def _forget_template_uuids(self, names: Iterable[str] | None = None) -> None:
+        """Drop by-name template uuids.
+
+        Called by :class:`~pyfsr.api.export_templates.ExportTemplatesAPI` after
+        it creates, updates or deletes a template, since any of those can change
+        which template a name resolves to, and by solution pack uninstall for the
+        pack's own template.
+
+        Args:
+            names: template names to forget; ``None`` forgets every name.
+        """
+        if names is None:
+            self._template_cache.clear()
+            return
+        for name in names:
+            self._template_cache.pop(name)
+
+    def prime_caches(
+        self,
+        *,
+        picklists: Iterable[Mapping[str, Any]] = (),
+        connectors: Iterable[Mapping[str, Any]] = (),
+        playbook_collections: Iterable[Mapping[str, Any]] = (),
+        templates: Iterable[Mapping[str, Any]] = (),
+    ) -> None:
+        """Seed the name lookups from records the caller already holds.
+
+        Each argument takes rows exactly as a bulk read returns them — e.g. the
+        members of ``GET /api/3/picklist_names``, a
+        ``content_hub.search_available_connectors()`` result, the members of
+        ``GET /api/3/workflow_collections`` or ``export_templates.list()`` — so a
+        script that already listed them pays no per-name lookup afterwards.
+        Rows missing the fields a lookup needs are skipped.
+
+        Example:
+            .. code-block:: python
+
+                names = client.get("/api/3/picklist_names", params={"$limit": 1000})
+                client.export_config.prime_caches(picklists=extract_members(names))
+        """
+        for row in picklists:
+            if row.get("name") and row.get("@id"):
+                self._picklist_cache.put(row["name"], row["@id"])
+        for row in connectors:
+            if row.get("label") and row.get("name") and row.get("version"):
+                self._connector_cache.put(row["label"], _connector_export_info(row))
+        for row in playbook_collections:
+            if row.get("name") and row.get("@id"):
+                self._collection_cache.put(row["name"], _collection_export_info(row))
+        for row in templates:
+            uuid = row.get("uuid") or (row.get("@id") or "").rsplit("/", 1)[-1]
+            if row.get("name") and uuid:
+                self._template_cache.put(row["name"], uuid)
 
     def _check_auth_support(self, operation: str | None = None) -> None:
         """Verify if the current auth method supports a specific operation"""
         self.client.auth.check_operation_supported(operation)
 
+    def _read_index(self, endpoint: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Read name rows from ``endpoint``, revalidating by ETag.
+
+        Without ``params`` this is the whole index (one max-size page); the
+        per-name lookups pass their filter instead. The rows are kept with the
+        response's ``ETag``, per endpoint and params; the next identical read
+        sends ``If-None-Match`` and a ``304 Not Modified`` reuses them instead
+        of re-downloading and re-parsing the body. Without an ``ETag`` this is
+        a plain GET.
+        """
+        if params is None:
+            params = {"$limit": _INDEX_LIMIT}
+        key = (endpoint, tuple(sorted(params.items())))
+        cached = self._index_etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.client.request("GET", endpoint, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return cached[1]
+        rows = extract_members(self.client._safe_json(response))
+        etag = response.headers.get("ETag")
+        if etag:
+            self._index_etags.put(key, (etag, rows))
+        else:
+            self._index_etags.pop(key)
+        return rows
+
     def _get_picklist_iri(self, picklist_name: str) -> str:
         """Look up picklist IRI by name"""
+        iri = self._picklist_cache.get(picklist_name)
+        if iri is not None:
+            return iri
         # Query picklist by name
-        response = self.client.get("/api/3/picklist_names", params={"name": picklist_name})
-        members = extract_members(response)
+        members = self._read_index("/api/3/picklist_names", {"name": picklist_name})
         if members:
-            return members[0]["@id"]
+            iri = members[0]["@id"]
+            self._picklist_cache.put(picklist_name, iri)
+            return iri
         else:
             raise ValueError(f"Picklist not found: {picklist_name}")
 
+    def _get_picklist_iris(self, picklist_names: list[str]) -> list[str]:
+        """Look up several picklist IRIs by name, in input order.
+
+        Cached names are served locally. One uncached name keeps the filtered
+        single-row GET; several share one read of the ``picklist_names`` index
+        (a few hundred small rows), instead of one request per name.
+        """
+        uncached = [name for name in picklist_names if self._picklist_cache.get(name) is None]
+        if len(uncached) <= 1:
+            return [self._get_picklist_iri(name) for name in picklist_names]
+        index: dict[str, str] = {}
+        for m in self._read_index("/api/3/picklist_names"):
+            index.setdefault(m.get("name"), m.get("@id"))
+        missing = [name for name in uncached if not index.get(name)]
+        if missing:
+            raise ValueError(f"Picklist not found: {', '.join(missing)}")
+        for name in uncached:
+            self._picklist_cache.put(name, index[name])
+        return [self._get_picklist_iri(name) for name in picklist_names]
+
     def _get_connector_info(self, connector_name: str) -> dict[str, Any]:
         """
         Look up connector details by name using ContentHubSearch.
@@ -640,43 +817,74 @@ class ExportConfigAPI(BaseAPI):
         Raises:
             ValueError: If connector is not found
         """
+        info = self._connector_cache.get(connector_name)
+        if info is not None:
+            return info
         connector = self.content_hub.find_available_connector(connector_name)
         if connector and connector.get("label") == connector_name:
-            return {
-                "value": f"cyops-connector-{connector['name']}-{connector['version']}",
-                "version": connector["version"],
-                "label": connector["label"],
-            }
+            info = _connector_export_info(connector)
+            self._connector_cache.put(connector_name, info)
+            return info
 
         raise ValueError(f"Connector not found: {connector_name}")
 
     def _get_playbook_collection_info(self, collection_name: str) -> dict[str, Any]:
         """Look up playbook collection details by name"""
+        info = self._collection_cache.get(collection_name)
+        if info is not None:
+            return info
         # Query playbook collections
-        response = self.client.get("/api/3/workflow_collections", params={"name": collection_name})
-        members = extract_members(response)
+        members = self._read_index("/api/3/workflow_collections", {"name": collection_name})
         if members:
-            collection = members[0]
-            return {"label": collection["name"], "value": collection["@id"].split("/")[-1]}
+            info = _collection_export_info(members[0])
+            self._collection_cache.put(collection_name, info)
+            return info
         else:
             raise ValueError(f"Playbook collection not found: {collection_name}")
 
+    def _get_playbook_collection_infos(self, collection_names: list[str]) -> list[dict[str, Any]]:
+        """Look up several playbook collections by name, in input order.
+
+        Same shape as :meth:`_get_picklist_iris`: cached names are served
+        locally, a single uncached name keeps the filtered GET, several share one
+        read of the collection list.
+        """
+        uncached = [name for name in collection_names if self._collection_cache.get(name) is None]
+        if len(uncached) <= 1:
+            return [self._get_playbook_collection_info(name) for name in collection_names]
+        index: dict[str, dict[str, Any]] = {}
+        for m in self._read_index("/api/3/workflow_collections"):
+            index.setdefault(m.get("name"), m)
+        missing = [name for name in uncached if name not in index]
+        if missing:
+            raise ValueError(f"Playbook collection not found: {', '.join(missing)}")
+        for name in uncached:
+            self._collection_cache.put(name, _collection_export_info(index[name]))
+        return [self._get_playbook_collection_info(name) for name in collection_names]
+
     def _get_template_uuid(self, template_name: str) -> str:
         """Look up an export template's uuid by name.
 
         The server-side ``name`` filter is a prefix/contains match, so results are
         re-checked for an exact name here. Names aren't unique — the most recently
-        created match wins, which is what the wizard's own list shows first.
+        created match wins, which is what the wizard's own list shows first. The
+        rows are requested newest-first, and ``createDate`` is re-checked here in
+        case the appliance ignores ``$orderby``.
         """
-        matching = [t for t in self.client.export_templates.list({"name": template_name}) if t.name == template_name]
-        if not matching:
+        uuid = self._template_cache.get(template_name)
+        if uuid is not None:
+            return uuid
+        templates = self._read_index("/api/3/export_templates", {"name": template_name, "$orderby": "-createDate"})
+        matches = [t for t in templates if t.get("name") == template_name]
+        if not matches:
             raise ValueError(f"Export template not found: {template_name}")
-        newest = sorted(matching, key=lambda t: t.createDate or 0, reverse=True)[0]
+        newest = max(matches, key=lambda t: t.get("createDate") or 0)
         # Live records carry both, and ``uuid`` equals the ``@id`` tail; fall back to
         # the IRI so a projection that selects only ``@id`` still resolves.
-        uuid = newest.uuid or (newest.iri or "").rsplit("/", 1)[-1]
+        uuid = newest.get("uuid") or (newest.get("@id") or "").rsplit("/", 1)[-1]
         if not uuid:
             raise ValueError(f"Export template {template_name!r} has neither a uuid nor an @id")
+        self._template_cache.put(template_name, uuid)
         return uuid
 
     def _trigger_export(self, template_uuid: str, filename: str) -> dict[str, Any]:
@@ -701,34 +909,49 @@ class ExportConfigAPI(BaseAPI):
         Returns:
             Path where the file was saved
 
-        Note:
-            The response will be binary data (application/zip) which is handled
-            by the client's get() method.
+        Raises:
+            TypeError: If the server answers with JSON metadata instead of the
+                archive bytes.
         """
-        # The files endpoint returns JSON metadata by default and only streams the
-        # raw archive when asked for octet-stream — without this header the GET
-        # comes back as a dict and the write below would fail.
-        content = self.client.get(file_iri, headers={"Accept": "application/octet-stream"})
-
         if not download_path:
             filename = file_iri.split("/")[-1]
             download_path = os.path.join(os.getcwd(), filename)
 
-        with open(download_path, "wb") as f:
-            if isinstance(content, bytes):
-                f.write(content)
-            else:
-                raise TypeError(f"Expected bytes response, got {type(content)}")
+        # The files endpoint returns JSON metadata by default and only streams the
+        # raw archive when asked for octet-stream. Stream it straight to disk in
+        # chunks: a large solution-pack export never sits in memory whole.
+        response = self.client.request("GET", file_iri, headers={"Accept": "application/octet-stream"}, stream=True)
+        with response:
+            content_type = response.headers.get("Content-Type", "")
+            if "application/json" in content_type:
+                raise TypeError(f"Expected bytes response, got JSON ({content_type})")
+            with open(download_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+                    f.write(chunk)
 
         return download_path
 
-    def _poll_export_completion(self, job_uuid: str, poll_interval: int = 5) -> ExportJobResult:
-        """Poll until export is complete"""
+    def _poll_export_completion(self, job_uuid: str, poll_interval: float = 5) -> ExportJobResult:
+        """Poll until export is complete.
+
+        Waits ``poll_interval`` seconds before the second check and 1.5x longer
+        after each non-terminal status, capped at a minute (or at
+        ``poll_interval`` if that is larger).
+
+        Raises:
+            FortiSOARException: If the job ends in a failed or cancelled state.
+        """
+        delay = poll_interval
+        ceiling = max(_EXPORT_POLL_CEILING, poll_interval)
         while True:
             status = self._get_export_status(job_uuid)
             if status.status == "Export Complete":
                 return status
-            time.sleep(poll_interval)
+            if str(status.status or "").strip().lower() in _EXPORT_FAILED:
+                detail = f": {status.errorMessage}" if status.errorMessage else ""
+                raise FortiSOARException(f"Export job {job_uuid} ended with status {status.status!r}{detail}")
+            time.sleep(delay)
+            delay = min(delay * _EXPORT_POLL_BACKOFF, ceiling)
 
     def _export_with_template(
         self,
@@ -736,13 +959,26 @@ class ExportConfigAPI(BaseAPI):
         output_path: str | None = None,
         filename: str | None = None,
         poll_interval: int = 5,
+        template_name: str | None = None,
     ) -> str:
-        """Common export workflow using template UUID"""
-        if not filename:
-            filename = f"export_{template_uuid}.zip"
+        """Common export workflow using template UUID.
 
-        # Trigger export
-        export_job = self._trigger_export(template_uuid, filename)
+        ``template_name`` marks ``template_uuid`` as resolved from the name
+        cache: a ``404`` on the trigger then means the cached uuid outlived its
+        template (deleted or re-created elsewhere), so the name is looked up
+        again and the trigger retried once.
+        """
+        try:
+            export_job = self._trigger_export(template_uuid, filename or f"export_{template_uuid}.zip")
+        except ResourceNotFoundError:
+            if template_name is None:
+                raise
+            self._template_cache.pop(template_name)
+            fresh_uuid = self._get_template_uuid(template_name)
+            if fresh_uuid == template_uuid:
+                raise
+            template_uuid = fresh_uuid
+            export_job = self._trigger_export(template_uuid, filename or f"export_{template_uuid}.zip")
         job_uuid = export_job["jobUuid"]
 
         # Poll until complete
@@ -761,7 +997,8 @@ class ExportConfigAPI(BaseAPI):
         Args:
             template_uuid: UUID of existing export template
             output_path: Optional path to save exported file
-            poll_interval: How often to check export status in seconds
+            poll_interval: Seconds before the first re-check of the export status;
+                later checks back off up to once a minute
 
         Returns:
             Path where exported file was saved
@@ -769,6 +1006,7 @@ class ExportConfigAPI(BaseAPI):
         Raises:
             UnsupportedAuthOperationError: If the current auth method does not support
                 configuration export
+            FortiSOARException: If the export job fails or is cancelled
 
         Example:
             >>> import tempfile
@@ -798,7 +1036,8 @@ class ExportConfigAPI(BaseAPI):
         Args:
             template_name: Name of existing export template
             output_path: Optional path to save exported file
-            poll_interval: How often to check export status in seconds
+            poll_interval: Seconds before the first re-check of the export status;
+                later checks back off up to once a minute
 
         Returns:
             Path where exported file was saved
@@ -806,6 +1045,7 @@ class ExportConfigAPI(BaseAPI):
         Raises:
             UnsupportedAuthOperationError: If the current auth method does not support
                 configuration export
+            FortiSOARException: If the export job fails or is cancelled
 
         Example:
             >>> import tempfile
@@ -823,13 +1063,14 @@ class ExportConfigAPI(BaseAPI):
         """
         self._check_auth_support(operation=BaseAuth.OPERATION_CONFIG_EXPORT)
         template_uuid = self._get_template_uuid(template_name)
-        filename = f"{template_name.lower().replace(' ', '_')}.zip" if not output_path else None
+        filename = f"{template_name.lower().translate(_FILENAME_TRANS)}.zip" if not output_path else None
 
         return self._export_with_template(
             template_uuid=template_uuid,
             output_path=output_path,
             filename=filename,
             poll_interval=poll_interval,
+            template_name=template_name,
         )
 
     def create_simplified_template(
@@ -884,45 +1125,44 @@ class ExportConfigAPI(BaseAPI):
                 }
                 modules_config.append(module_config)
 
-        # Look up picklist IRIs
-        picklist_iris = []
-        if picklists:
-            picklist_iris = [self._get_picklist_iri(name) for name in picklists]
+        # Picklists and collections each resolve from one shared read; the
+        # connector lookups are independent Content Hub searches, so they fan out
+        # over the bounded thread pool. An unknown name still raises before
+        # anything is posted.
+        picklist_iris = self._get_picklist_iris(picklists or [])
+        collection_infos = self._get_playbook_collection_infos(playbook_collections or [])
+        connector_infos = map_threaded(self._get_connector_info, connectors or [], on_error="raise")
 
         # Look up connector configurations
         connector_configs = []
-        if connectors:
-            for connector in connectors:
-                info = self._get_connector_info(connector)
-                connector_configs.append(
-                    {
-                        "label": info["label"],
-                        "value": info["value"],
-                        "rpm": True,
-                        "configurations": True,
-                        "configCount": 1,
-                        "version": info["version"],
-                        "include": True,
-                        "recordCount": 0,
-                    }
-                )
+        for info in connector_infos:
+            connector_configs.append(
+                {
+                    "label": info["label"],
+                    "value": info["value"],
+                    "rpm": True,
+                    "configurations": True,
+                    "configCount": 1,
+                    "version": info["version"],
+                    "include": True,
+                    "recordCount": 0,
+                }
+            )
 
         # Look up playbook collection details
         playbook_config = {"collections": [], "globalVariables": []}
-        if playbook_collections:
-            for collection in playbook_collections:
-                info = self._get_playbook_collection_info(collection)
-                playbook_config["collections"].append(
-                    {
-                        "label": info["label"],
-                        "value": info["value"],
-                        "includeGlobalVariables": True,
-                        "includeSchedules": True,
-                        "includeVersions": True,
-                        "include": True,
-                        "recordCount": 0,
-                    }
-                )
+        for info in collection_infos:
+            playbook_config["collections"].append(
+                {
+                    "label": info["label"],
+                    "value": info["value"],
+                    "includeGlobalVariables": True,
+                    "includeSchedules": True,
+                    "includeVersions": True,
+                    "include": True,
+                    "recordCount": 0,
+                }
+            )
 
         # Build complete template
         options = {
@@ -931,20 +1171,7 @@ class ExportConfigAPI(BaseAPI):
             "connectors": connector_configs,
             "playbooks": playbook_config,
             "viewTemplates": view_templates or [],
-            # Add empty lists for other optional components
-            "recordSets": [],
-            "views": [],
-            "reports": [],
-            "dashboards": [],
-            "roles": [],
-            "teams": [],
-            "actors": [],
-            "widgets": [],
-            "appSettings": [],
-            "showOnlyConfigured": [],
-            "preprocessingRules": [],
-            "ruleChannels": [],
-            "rules": [],
+            **{section: [] for section in _SIMPLIFIED_EMPTY_SECTIONS},
             "playbookBlocks": {"blocks": [], "includeGlobalVariables": True},
         }
 
@@ -956,6 +1183,9 @@ class ExportConfigAPI(BaseAPI):
         self, name: str, options: dict[str, Any], metadata: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Create the actual export template - internal method"""
+        # A new template with this name becomes the "newest" one a by-name
+        # export should pick, so forget any uuid cached for the name.
+        self._template_cache.pop(name)
         template_data = {
             "name": name,
             "options": options,
@@ -1010,7 +1240,7 @@ class ExportConfigAPI(BaseAPI):
                 entry["query"]["limit"] = int(total)
 
         if template._picklists:
-            options["picklistNames"] = [self._get_picklist_iri(name) for name in template._picklists]
+            options["picklistNames"] = self._get_picklist_iris(template._picklists)
 
         if template._connectors:
             connectors: list[dict[str, Any]] = []
@@ -1029,8 +1259,8 @@ class ExportConfigAPI(BaseAPI):
 
         if template._collections:
             collections: list[dict[str, Any]] = []
-            for spec in template._collections:
-                info = self._get_playbook_collection_info(spec["name"])
+            infos = self._get_playbook_collection_infos([spec["name"] for spec in template._collections])
+            for spec, info in zip(template._collections, infos, strict=True):
                 collections.append(
                     PlaybookCollectionSelection(
                         value=info["value"],
@@ -1272,7 +1502,8 @@ class ExportConfigAPI(BaseAPI):
             output_path: where to write the ``.zip`` (default: cwd, derived name).
             label: friendly record-set name (defaults to ``module``).
             cleanup_template: delete the temporary export template afterwards.
-            poll_interval: seconds between export-status polls.
+            poll_interval: seconds before the first export-status re-poll (later
+                polls back off up to once a minute).
 
         Returns:
             Path to the downloaded ``.zip``.
@@ -1349,7 +1580,8 @@ class ExportConfigAPI(BaseAPI):
             include_configurations: include the connector's saved configs
                 (default True — the whole point of a backup).
             cleanup_template: delete the temporary export template afterwards.
-            poll_interval: seconds between export-status polls.
+            poll_interval: seconds before the first export-status re-poll (later
+                polls back off up to once a minute).
 
         Returns:
             Path to the downloaded ``.zip``.
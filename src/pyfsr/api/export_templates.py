@@ -27,6 +27,13 @@ _BASE = "/api/3/export_templates"
 class ExportTemplatesAPI(BaseAPI):
     """Create, list, fetch, and delete export templates."""
 
+    def _forget_template_uuids(self) -> None:
+        # ``client.export_config`` caches name -> uuid for by-name exports; a
+        # create/update/delete here can change what a name resolves to.
+        export_config = getattr(self.client, "export_config", None)
+        if export_config is not None:
+            export_config._forget_template_uuids()
+
     def create(self, name: str, *, options: dict[str, Any] | None = None, **fields: Any) -> ExportTemplate:
         """Create an export template.
 
@@ -38,7 +45,9 @@ class ExportTemplatesAPI(BaseAPI):
         if options is not None:
             payload["options"] = options
         payload.update(fields)
-        return ExportTemplate.model_validate(self.client.post(_BASE, data=payload))
+        created = ExportTemplate.model_validate(self.client.post(_BASE, data=payload))
+        self._forget_template_uuids()
+        return created
 
     def list(self, params: dict[str, Any] | None = None) -> list[ExportTemplate]:
         """List export templates as typed :class:`~pyfsr.models.ExportTemplate` records."""
@@ -91,8 +100,11 @@ class ExportTemplatesAPI(BaseAPI):
             payload["options"] = options
         if not payload:
             raise ValueError("update() requires at least one field to change")
-        return ExportTemplate.model_validate(self.client.put(f"{_BASE}/{iri_to_uuid(ref)}", data=payload))
+        updated = ExportTemplate.model_validate(self.client.put(f"{_BASE}/{iri_to_uuid(ref)}", data=payload))
+        self._forget_template_uuids()
+        return updated
 
     def delete(self, ref: str) -> None:
         """Delete an export template by uuid or IRI."""
         self.client.delete(f"{_BASE}/{iri_to_uuid(ref)}")
+        self._forget_template_uuids()
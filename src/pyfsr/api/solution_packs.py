@@ -37,8 +37,13 @@ class SolutionPackAPI(BaseAPI):
 
     def __init__(self, client):
         super().__init__(client)
-        self.export_config = ExportConfigAPI(client)
-        self.content_hub = ContentHubSearch(client)
+        # Share the client's own wrappers (built before this one) so their name
+        # and pack-search caches serve both ``client.export_config`` /
+        # ``client.content_hub`` and the pack operations here.
+        export_config = getattr(client, "export_config", None)
+        content_hub = getattr(client, "content_hub", None)
+        self.export_config = export_config if isinstance(export_config, ExportConfigAPI) else ExportConfigAPI(client)
+        self.content_hub = content_hub if isinstance(content_hub, ContentHubSearch) else ContentHubSearch(client)
 
     def export_pack(self, pack_identifier: str, output_path: str | None = None, poll_interval: int = 5) -> str:
         """
@@ -58,7 +63,9 @@ class SolutionPackAPI(BaseAPI):
                 export_path = client.solution_packs.export_pack("SOAR Framework")
                 print(f"Exported to: {export_path}")
         """
-        pack = self.content_hub.find_installed_pack(pack_identifier)
+        # Reuses a search from the last minute: repeat exports of a pack resolve
+        # it once, and an export of a pack removed meanwhile fails at the export.
+        pack = self.content_hub.find_installed_pack(pack_identifier, use_cache=True)
 
         if not pack:
             raise ValueError(f"An Installed Solution pack was not found with the search term: {pack_identifier}")
@@ -143,6 +150,7 @@ class SolutionPackAPI(BaseAPI):
         if build_number is not None:
             body["buildNumber"] = build_number
         resp = self.client.post("/api/3/solutionpacks/install", data=body)
+        self.content_hub.clear_cache()
         if not isinstance(resp, dict):
             return SolutionPackInstallResponse()
         install_resp = SolutionPackInstallResponse.model_validate(resp)
@@ -181,6 +189,9 @@ class SolutionPackAPI(BaseAPI):
         while str(status.status or "").strip().lower() not in _INSTALL_TERMINAL and time.monotonic() < deadline:
             time.sleep(interval)
             status = self.install_status(job_id)
+        if str(status.status or "").strip().lower() in _INSTALL_TERMINAL:
+            # A memoized search made while the job ran predates the install.
+            self.content_hub.clear_cache()
         return status
 
     def uninstall(self, name: str) -> None:
@@ -202,7 +213,7 @@ class SolutionPackAPI(BaseAPI):
 
                 client.solution_packs.uninstall("SOAR Framework")
         """
-        pack = self.content_hub.find_installed_pack(name)
+        pack = self.content_hub.find_installed_pack(name, use_cache=True)
         if not pack:
             raise ValueError(f"No installed solution pack found matching {name!r}")
         uuid = pack.get("uuid") or (
@@ -211,6 +222,14 @@ class SolutionPackAPI(BaseAPI):
         if not uuid:
             raise ValueError(f"Cannot resolve UUID for solution pack {name!r}")
         self.client.delete(f"/api/3/solutionpacks/{uuid}")
+        self.content_hub.clear_cache()
+        # The appliance deletes the pack's export template along with it; the
+        # template is named after the pack, so forget only those names.
+        template = pack.get("template")
+        names = {pack.get("name"), pack.get("label")}
+        if isinstance(template, dict):
+            names.add(template.get("name"))
+        self.export_config._forget_template_uuids(n for n in names if n)
 
     def create(self, builder: SolutionPackBuilder, *, publish: bool = False) -> SolutionPackInstallResponse:
         """Author a new local solution pack from a :class:`SolutionPackBuilder`.
@@ -271,6 +290,7 @@ class SolutionPackAPI(BaseAPI):
         if builder._categories:
             body["category"] = list(builder._categories)
         resp = self.client.post("/api/3/solutionpacks", data=body)
+        self.content_hub.clear_cache()
         return SolutionPackInstallResponse.model_validate(resp)
 
     def install_from_file(
@@ -309,6 +329,7 @@ class SolutionPackAPI(BaseAPI):
                 client.solution_packs.install_from_file("MyPack-1.0.0.zip", wait=True)
         """
         resp = upload_solutionpack(self.client, path, type_="solutionpack", replace=replace)
+        self.content_hub.clear_cache()
         parsed = SolutionPackInstallResponse.model_validate(resp)
         if not wait:
             return parsed
@@ -345,6 +366,7 @@ class SolutionPackAPI(BaseAPI):
             installed (``.version`` confirms the match); the install response or
             final :class:`~pyfsr.models.InstallJobStatus` when newly installed.
         """
+        # Always a fresh search: this decides whether to install.
         existing = self.content_hub.find_installed_pack(name)
         if existing is not None and existing.version == version:
             return SolutionPackInstallResponse.model_validate(existing.to_dict())
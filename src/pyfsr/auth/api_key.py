@@ -1,11 +1,23 @@
 """API key authentication for FortiSOAR"""
 
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 
+from .._cache import TTLCache, digest_key
 from ..exceptions import APIError
 from ._url import normalize_base_url
 from .base import BaseAuth
 
+#: Keys that validated recently, process-wide, keyed by ``digest_key(base_url,
+#: api_key)``. Scripts that build a short-lived client per task skip the probe
+#: for a key any instance validated in the last five minutes.
+_VALIDATED_KEYS = TTLCache(maxsize=1024, ttl=300.0)
+
+#: Probe statuses that mean the key authenticated (see _validate_api_key on 403).
+_KEY_ACCEPTED = frozenset({200, 204, 403})
+
 
 class APIKeyAuth(BaseAuth):
     """
@@ -19,6 +31,12 @@ class APIKeyAuth(BaseAuth):
         base_url: Base URL of the FortiSOAR instance
         api_key: The FortiSOAR API key
         verify_ssl: Whether to verify SSL certificates. Defaults to True.
+        validate: Probe the appliance to check the key on construction. Pass
+            False to skip that round-trip; a bad key then surfaces as an
+            ``AuthenticationError`` (401) on the first real request.
+        session: Session to send the validation probe on. The client passes
+            its own, so the probe's connection is the one its first request
+            reuses. Defaults to a private keep-alive session.
 
     Raises:
         APIError: If API key validation fails
@@ -31,31 +49,66 @@ class APIKeyAuth(BaseAuth):
         >>> headers = auth.get_auth_headers()
     """
 
-    def __init__(self, base_url: str, api_key: str, verify_ssl: bool = True):
+    _unsupported_operations = frozenset({BaseAuth.OPERATION_AUTH, BaseAuth.OPERATION_CONFIG_EXPORT})
+
+    # How long a successful validation is trusted by :meth:`is_valid` before it
+    # re-probes the appliance. A key is rarely revoked mid-run; polling callers
+    # shouldn't pay a round-trip per check to find out it wasn't.
+    _validation_ttl = 300.0
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        verify_ssl: bool = True,
+        *,
+        validate: bool = True,
+        session: requests.Session | None = None,
+    ):
         super().__init__()
         self.api_key = api_key
         self.base_url = normalize_base_url(base_url)
         self.verify_ssl = verify_ssl
+        self._last_validated_at: float | None = None
+
+        # One keep-alive session for every validation probe (construction and
+        # each is_valid() re-check) instead of a fresh TCP + TLS handshake per
+        # module-level requests.get(). The key travels per probe, so a shared
+        # session's own headers are left alone.
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            session.verify = verify_ssl
+        self._session = session
+
+        if validate:
+            self._validate_api_key()
 
-        # Set unsupported operations
-        self._unsupported_operations = {
-            self.OPERATION_AUTH,
-            self.OPERATION_CONFIG_EXPORT,
-        }
-
-        self._validate_api_key()
-
-    def _validate_api_key(self) -> None:
+    def _validate_api_key(self, *, force: bool = False) -> None:
         """
         Validates the API key by making a test request to the FortiSOAR API.
 
+        A key that any instance validated against the same appliance within the
+        last five minutes is accepted without a request, unless ``force``.
+
         Raises:
             APIError: If validation fails
         """
-        headers = self.get_auth_headers()
+        cache_key = digest_key(self.base_url, self.api_key)
+        if not force and _VALIDATED_KEYS.get(cache_key):
+            self._last_validated_at = time.monotonic()
+            return
         url = f"{self.base_url}/api/3/people"
         try:
-            response = requests.get(url, headers=headers, verify=self.verify_ssl)
+            # Only the status matters, so ask with HEAD and skip the People
+            # collection body (redirects are not followed). A 2xx/401/403 from
+            # HEAD is authoritative; anything else (e.g. 405 where HEAD isn't
+            # routed) is re-asked as a one-row GET, which also gives the error
+            # below a body to quote.
+            response = self._session.head(url, headers=self._auth_headers, allow_redirects=False)
+            if response.status_code != 401 and response.status_code not in _KEY_ACCEPTED:
+                response = self._session.get(url, params={"$limit": 1, "$page": 1}, headers=self._auth_headers)
 
             # 401 is the only status that means the key itself is bad. A 403
             # (Access Denied) means the key authenticated successfully but its
@@ -64,8 +117,9 @@ class APIKeyAuth(BaseAuth):
             # as valid; surfacing it as a validation failure would make every
             # least-privilege key unusable.
             if response.status_code == 401:
+                _VALIDATED_KEYS.pop(cache_key)
                 raise APIError(f"Invalid API key - authentication failed at {url}")
-            elif response.status_code not in (200, 403):
+            elif response.status_code not in _KEY_ACCEPTED:
                 hint = ""
                 if not response.text and response.status_code in (404, 405, 502, 503):
                     hint = (
@@ -80,24 +134,59 @@ class APIKeyAuth(BaseAuth):
         except requests.exceptions.RequestException as e:
             raise APIError(f"API key validation request failed: {str(e)}") from e
 
+        self._last_validated_at = time.monotonic()
+        _VALIDATED_KEYS.put(cache_key, True)
+
+    @property
+    def api_key(self) -> str:
+        """The FortiSOAR API key."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        # Headers are built once per key rather than on every get_auth_headers()
+        # call; swapping the key rebuilds them.
+        self._api_key = value
+        self._auth_headers = {"Authorization": f"API-KEY {value}", "Content-Type": "application/json"}
+
     def get_auth_headers(self) -> dict:
         """
         Get the authentication headers required for API requests.
 
         Returns:
-            dict: Headers including the API key authentication
+            dict: Headers including the API key authentication. A copy, so the
+            caller may add to it freely.
         """
-        return {"Authorization": f"API-KEY {self.api_key}", "Content-Type": "application/json"}
+        return self._auth_headers.copy()
 
-    def is_valid(self) -> bool:
+    def is_valid(self, *, force: bool = False) -> bool:
         """
         Check if the API key is currently valid.
 
+        A successful validation is trusted for five minutes, so repeated checks
+        from a polling loop don't each cost a request. Failures are never cached.
+
+        Args:
+            force: Re-probe the appliance even if the key validated recently.
+
         Returns:
             bool: True if the API key passes validation, False otherwise
         """
+        if (
+            not force
+            and self._last_validated_at is not None
+            and time.monotonic() - self._last_validated_at < self._validation_ttl
+        ):
+            return True
+        self._last_validated_at = None
         try:
-            self._validate_api_key()
+            self._validate_api_key(force=force)
             return True
         except APIError:
             return False
+
+    def close(self) -> None:
+        """Close the pooled connections used for key validation (a session passed
+        in by the caller is left open)."""
+        if self._owns_session:
+            self._session.close()
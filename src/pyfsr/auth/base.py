@@ -15,9 +15,9 @@ class BaseAuth(ABC):
     OPERATION_PLAYBOOK = "playbook"  # Playbook operations
     OPERATION_SOLUTION_PACK = "solution_pack"  # Solution pack operations
 
-    def __init__(self):
-        """Initialize base auth class"""
-        self._unsupported_operations: set[str] = set()
+    # Operations this auth method can't perform. Constant per auth class, so
+    # subclasses override it at class level rather than building a set per instance.
+    _unsupported_operations: frozenset[str] = frozenset()
 
     @property
     def auth_type(self) -> str:
@@ -49,7 +49,7 @@ class BaseAuth(ABC):
         return False
 
     @property
-    def unsupported_operations(self) -> set[str]:
+    def unsupported_operations(self) -> frozenset[str]:
         """Get set of unsupported operations"""
         return self._unsupported_operations
 
@@ -19,18 +19,21 @@ from .base import BaseAuth
 class NoAuth(BaseAuth):
     """Unauthenticated strategy — for public endpoints only (no credentials)."""
 
+    # Everything that needs a real identity is unsupported on a public client.
+    _unsupported_operations = frozenset(
+        {
+            BaseAuth.OPERATION_AUTH,
+            BaseAuth.OPERATION_CONFIG_EXPORT,
+            BaseAuth.OPERATION_CONFIG_IMPORT,
+            BaseAuth.OPERATION_PLAYBOOK,
+            BaseAuth.OPERATION_SOLUTION_PACK,
+        }
+    )
+
     def __init__(self, base_url: str = "", verify_ssl: bool = True):
         super().__init__()
         self.base_url = base_url
         self.verify_ssl = verify_ssl
-        # Everything that needs a real identity is unsupported on a public client.
-        self._unsupported_operations = {
-            self.OPERATION_AUTH,
-            self.OPERATION_CONFIG_EXPORT,
-            self.OPERATION_CONFIG_IMPORT,
-            self.OPERATION_PLAYBOOK,
-            self.OPERATION_SOLUTION_PACK,
-        }
 
     def get_auth_headers(self) -> dict:
         """No credentials — send no auth header."""
@@ -8,10 +8,18 @@ response. Selected by passing ``username``/``password`` to
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .._cache import TTLCache, digest_key
 from ._url import normalize_base_url
 from .base import BaseAuth
 
+#: Session tokens minted recently, process-wide, keyed by ``digest_key(base_url,
+#: username, password)``, so constructing several clients for the same login
+#: authenticates once. Kept well inside the appliance's token lifetime; a token
+#: that expires anyway is recovered by the client's refresh-and-retry.
+_TOKENS = TTLCache(maxsize=256, ttl=600.0)
+
 
 class UserPasswordAuth(BaseAuth):
     """Authenticate with a username and password, holding a refreshable token.
@@ -20,20 +28,43 @@ class UserPasswordAuth(BaseAuth):
     error body on a ``404``/``405``/``502``/``503`` is reported as a connectivity
     problem (wrong port/scheme or a proxy in the way) rather than bad
     credentials, since the request likely never reached the auth endpoint.
+
+    Logins (construction and every :meth:`refresh`) go over ``session`` when
+    given — the client passes its own, so the first API call reuses the login's
+    connection — or a private keep-alive session otherwise.
     """
 
-    def __init__(self, base_url: str, username: str, password: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify_ssl: bool = True,
+        *,
+        session: requests.Session | None = None,
+    ):
         super().__init__()
         self.base_url = normalize_base_url(base_url)
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
-        self.token = self._authenticate()
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+            session.verify = verify_ssl
+        self._session = session
+        self.token = _TOKENS.get(self._token_key()) or self._authenticate()
+
+    def _token_key(self) -> str:
+        return digest_key(self.base_url, self.username, self.password)
 
     def _authenticate(self) -> str:
         auth_url = f"{self.base_url}/auth/authenticate"
         payload = {"credentials": {"loginid": self.username, "password": self.password}}
-        response = requests.post(auth_url, json=payload, verify=self.verify_ssl)
+        # A shared session may already carry the previous (expired) bearer
+        # token; the login request must not send it.
+        response = self._session.post(auth_url, json=payload, headers={"Authorization": None})
         if not response.ok:
             try:
                 detail = response.json()
@@ -56,11 +87,28 @@ class UserPasswordAuth(BaseAuth):
                 f"Authentication failed ({response.status_code}) at {auth_url}: {detail}{hint}",
                 response=response,
             )
-        return response.json()["token"]
+        token = response.json()["token"]
+        _TOKENS.put(self._token_key(), token)
+        return token
+
+    @property
+    def token(self) -> str:
+        """The current bearer session token."""
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        # Headers are built once per token (login or refresh) rather than on
+        # every get_auth_headers() call.
+        self._token = value
+        self._auth_headers = {"Authorization": f"Bearer {value}", "Content-Type": "application/json"}
 
     def get_auth_headers(self) -> dict:
-        """Return the request headers carrying the current bearer token."""
-        return {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
+        """Return the request headers carrying the current bearer token.
+
+        A copy, so the caller may add to it freely.
+        """
+        return self._auth_headers.copy()
 
     def refresh(self) -> dict:
         """Re-authenticate (mint a fresh session token) and return new headers.
@@ -72,6 +120,11 @@ class UserPasswordAuth(BaseAuth):
         self.token = self._authenticate()
         return self.get_auth_headers()
 
+    def close(self) -> None:
+        """Close the pooled login connection (a session passed in by the caller is left open)."""
+        if self._owns_session:
+            self._session.close()
+
     @property
     def can_refresh(self) -> bool:
         """``True`` — this strategy can re-authenticate, so the client retries expired tokens."""
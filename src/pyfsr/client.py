@@ -1,11 +1,17 @@
 """Main client class for FortiSOAR API"""
 
+import asyncio
+import atexit
 import logging
 import os
+import queue
 import re
 import sys
+import threading
 import time
 import warnings
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import TYPE_CHECKING, Any, Literal, overload
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -83,8 +89,101 @@ from .models import (
 from .records import RecordSet
 from .utils.file_operations import FileOperations
 
+try:
+    # Optional: when orjson is installed, response bodies are decoded with it
+    # (several times faster than the stdlib on large hydra collections).
+    from orjson import loads as _fast_json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _fast_json_loads = None
+
 logger = logging.getLogger("pyfsr")
 
+# Verbose logging is one process-wide sink on the shared "pyfsr" logger: a
+# QueueHandler feeding a single listener thread. Every verbose client holds a
+# reference; the last close() (or interpreter exit) tears it down, so N
+# verbose clients never write each record N times or leave N threads behind.
+_verbose_lock = threading.Lock()
+_verbose_sink: tuple[QueueHandler, QueueListener] | None = None
+_verbose_users = 0
+
+
+def _acquire_verbose_logging(log_file: str, max_bytes: int, backup_count: int) -> tuple[QueueHandler, QueueListener]:
+    """Install the verbose log sink on first use and take a reference to it."""
+    global _verbose_sink, _verbose_users
+    with _verbose_lock:
+        if _verbose_sink is None:
+            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+            # Ensure log directory exists
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+
+            # Rotating file handler (opened on the first record) plus console
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+            )
+            file_handler.setFormatter(formatter)
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+
+            # The handlers write on the listener thread; request threads only
+            # enqueue records, so file/console I/O stays off the HTTP path.
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            listener = QueueListener(log_queue, file_handler, console_handler)
+            listener.start()
+            logger.addHandler(queue_handler)
+            # Flush what's still queued if the script exits without close().
+            atexit.register(_shutdown_verbose_logging)
+            _verbose_sink = (queue_handler, listener)
+        _verbose_users += 1
+        return _verbose_sink
+
+
+def _release_verbose_logging(listener: QueueListener) -> None:
+    """Drop one reference to the verbose log sink, tearing it down after the last.
+
+    A ``listener`` from a sink already torn down (at exit) is ignored rather
+    than counted against its replacement.
+    """
+    global _verbose_users
+    with _verbose_lock:
+        if _verbose_sink is None or _verbose_sink[1] is not listener:
+            return
+        _verbose_users = max(_verbose_users - 1, 0)
+        if not _verbose_users:
+            _teardown_verbose_sink()
+
+
+def _shutdown_verbose_logging() -> None:
+    """Flush and remove the verbose log sink, if installed (the atexit hook)."""
+    with _verbose_lock:
+        _teardown_verbose_sink()
+
+
+def _teardown_verbose_sink() -> None:
+    # Caller holds _verbose_lock.
+    global _verbose_sink, _verbose_users
+    if _verbose_sink is None:
+        return
+    queue_handler, listener = _verbose_sink
+    _verbose_sink = None
+    _verbose_users = 0
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    atexit.unregister(_shutdown_verbose_logging)
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Keep-alive pool sizing for the mounted HTTPAdapter. A client talks to one
+# appliance, so few host pools are needed, but each must hold enough
+# connections for the thread-pooled helpers to reuse instead of re-handshaking.
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 32
+
+# Response media types FortiSOAR.get hands back as raw bytes instead of JSON.
+_BINARY_MEDIA_TYPES = frozenset({"application/zip", "application/octet-stream"})
+
 # Header names whose values are secrets and must never be logged in full.
 _SENSITIVE_HEADERS = {"authorization", "x-api-key", "cookie", "csrf-token"}
 
@@ -105,6 +204,36 @@ def _mask_headers(headers: dict) -> dict:
     return masked
 
 
+@lru_cache(maxsize=512)
+def _normalize_endpoint(endpoint: str) -> tuple[str, bool]:
+    """Resolve a caller's endpoint to the appliance path it's sent to.
+
+    Pure and memoized: scripts hit the same handful of endpoints thousands of
+    times, so the prefix checks run once per distinct string.
+
+    Returns:
+        tuple: ``(path, is_auth)`` — the rooted, ``/api/3``-prefixed path and
+        whether it is an ``/api/auth/`` route (unsupported under API-key auth).
+    """
+    is_auth = endpoint.startswith("/api/auth/")
+
+    # Ensure endpoint starts with /
+    if not endpoint.startswith("/"):
+        endpoint = f"/{endpoint}"
+
+    # Add API version prefix if not present. A handful of fsr-ai routes
+    # (connector-backed MCP server wiring) live at the appliance root
+    # rather than under /api/3 — e.g. POST /mcp/config/export,
+    # /mcp/add/tools, /mcp/tools/{uuid}, /mcp/servers/connector — so are
+    # excluded from the default prefixing, same as /auth/ and /api/public/.
+    # The rule-engine app (delivery rules / channels) is served from its own
+    # /rule/api/ root, likewise outside /api/3. Anything already under /api/
+    # (/api/3/, /api/public/, /api/query/, /api/wf/, ...) is left as is.
+    if not endpoint.startswith(("/api/", "/auth/", "/mcp/", "/rule/")):
+        endpoint = f"/api/3{endpoint}"
+    return endpoint, is_auth
+
+
 class FortiSOAR:
     """
     Main FortiSOAR client class for interacting with the FortiSOAR API.
@@ -117,6 +246,10 @@ class FortiSOAR:
     #: directly-constructed clients.
     _instance_alias: str | None = None
 
+    #: The process-wide verbose log writer this client holds a reference to
+    #: (``verbose=True`` only); released by :meth:`close`.
+    _log_listener: QueueListener | None = None
+
     def __init__(
         self,
         base_url: str,
@@ -137,6 +270,7 @@ class FortiSOAR:
         dry_run: bool = False,
         http_trace: bool = False,
         public: bool = False,
+        validate_api_key: bool = True,
     ):
         """
         Initialize the FortiSOAR client.
@@ -160,6 +294,12 @@ class FortiSOAR:
                appliance (``FSR-Auth-018`` duplicate-license lockout) where no
                credential authenticates. Authenticated calls are unsupported on
                such a client. Defaults to False.
+           validate_api_key (bool, optional): With API-key auth, probe the
+               appliance on construction so a bad key fails immediately. Pass
+               False to skip that round-trip (a short-lived script making one
+               call pays it twice otherwise); a bad key then raises
+               ``AuthenticationError`` on the first request instead. Defaults
+               to True.
            verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
            suppress_insecure_warnings (bool, optional): Whether to suppress insecure request
                warnings. Defaults to False.
@@ -196,6 +336,20 @@ class FortiSOAR:
         Raises:
             ValueError: If the provided authentication method is invalid.
         """
+        # Check the credential shape before any side effects (log directory and
+        # handlers, session), so bad input fails fast and leaves nothing behind.
+        # `public=True` builds a no-auth client for the unauthenticated
+        # endpoints (version, /api/public/license) — the only way in on a fresh
+        # or license-locked appliance, where no credential works.
+        credentials: tuple[str, str, str | None] | None = None
+        if public:
+            if auth is not None or username or password or token or api_key:
+                raise ValueError("public=True takes no credentials (it is for unauthenticated endpoints).")
+        else:
+            credentials = self._resolve_credentials(
+                auth=auth, username=username, password=password, token=token or api_key
+            )
+
         # Private logging configuration
         self._log_level = logging.INFO
         self._log_file = "logs/fortisoar.log"
@@ -206,23 +360,10 @@ class FortiSOAR:
         # Setup logging if enabled
         self.verbose = verbose
         if verbose:
-            # Create formatter
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-            # Ensure log directory exists
-            log_dir = os.path.dirname(os.path.abspath(self._log_file))
-            os.makedirs(log_dir, exist_ok=True)
-
-            # Create rotating file handler
-            file_handler = logging.FileHandler(self._log_file)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-
-            # Also add console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
-
+            # Shared with every other verbose client in the process.
+            self._log_queue_handler, self._log_listener = _acquire_verbose_logging(
+                self._log_file, self._max_log_size, self._backup_count
+            )
             logger.setLevel(self._log_level)
 
         # Ensure base_url starts with https://
@@ -252,6 +393,11 @@ class FortiSOAR:
             base_url = urlunparse(parsed._replace(netloc=netloc))
 
         self.base_url: str = base_url
+        # scheme://host[:port] of base_url. Every endpoint is an absolute path,
+        # so joining is plain concatenation onto the origin -- the same URL
+        # urljoin() produced, without re-parsing both strings on every request.
+        _parsed = urlparse(base_url)
+        self._origin: str = f"{_parsed.scheme}://{_parsed.netloc}"
 
         if self.verbose:
             logger.info(f"Initializing FortiSOAR client for {self.base_url}")
@@ -266,6 +412,7 @@ class FortiSOAR:
 
         # Retry transient failures (connect errors + 429/5xx) on idempotent
         # methods with exponential backoff; writes are never auto-retried.
+        retry: Retry | int = 0
         if max_retries:
             retry = Retry(
                 total=max_retries,
@@ -277,28 +424,27 @@ class FortiSOAR:
                 allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
                 raise_on_status=False,
             )
-            adapter = HTTPAdapter(max_retries=retry)
-            self.session.mount("https://", adapter)
-            self.session.mount("http://", adapter)
+        # Always mount our own adapter so the keep-alive pool is sized for the
+        # threaded helpers (aggregate_many, bulk gets): requests' default keeps
+        # 10 connections per host and discards the rest, forcing a fresh TLS
+        # handshake for every extra worker.
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if suppress_insecure_warnings:
             requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
-        # Setup authentication. `public=True` builds a no-auth client for the
-        # unauthenticated endpoints (version, /api/public/license) — the only way
-        # in on a fresh or license-locked appliance, where no credential works.
-        if public:
-            if auth is not None or username or password or token or api_key:
-                raise ValueError("public=True takes no credentials (it is for unauthenticated endpoints).")
+        # Setup authentication
+        if credentials is None:
             from .auth.no_auth import NoAuth
 
             self.auth = NoAuth(self.base_url, verify_ssl)
         else:
-            self.auth = self._resolve_auth(
-                auth=auth,
-                username=username,
-                password=password,
-                token=token or api_key,
-            )
+            self.auth = self._resolve_auth(credentials, validate_api_key=validate_api_key)
 
         # Apply authentication headers
         self.session.headers.update(self.auth.get_auth_headers())
@@ -416,62 +562,86 @@ class FortiSOAR:
         data: dict | list | None,
         headers: dict | None,
     ) -> None:  # pragma: no cover
-        """Log request details when verbose mode is enabled."""
+        """Log request details when verbose mode is enabled.
+
+        ``headers`` are the per-request extras; they're shown merged over the
+        session's headers, as they'll be sent.
+        """
         if not self.verbose:
             return
 
-        logger.info(f"\n{'=' * 50}\nRequest:")
-        logger.info(f"Method: {method}")
-        logger.info(f"URL: {url}")
+        logger.info("\n%s\nRequest:", "=" * 50)
+        logger.info("Method: %s", method)
+        logger.info("URL: %s", url)
 
+        headers = {**self.session.headers, **(headers or {})}
         if headers:
             logger.info("Headers:")
             for key, value in _mask_headers(headers).items():
-                logger.info(f"  {key}: {value}")
+                logger.info("  %s: %s", key, value)
 
         if params:
             logger.info("Query Parameters:")
             for key, value in params.items():
-                logger.info(f"  {key}: {value}")
+                logger.info("  %s: %s", key, value)
 
         if data:
             logger.info("Request Data:")
-            logger.info(f"  {data}")
+            logger.info("  %s", data)
 
-    def _log_response(self, response: requests.Response, elapsed: float) -> None:  # pragma: no cover
-        """Log response details when verbose mode is enabled."""
+    def _log_response(
+        self, response: requests.Response, elapsed: float, *, streamed: bool = False
+    ) -> None:  # pragma: no cover
+        """Log response details when verbose mode is enabled.
+
+        A ``streamed`` body is left unread (logging it would pull the whole
+        download into memory); only its declared length is logged.
+        """
         if not self.verbose:
             return
 
         logger.info("\nResponse:")
-        logger.info(f"Status Code: {response.status_code}")
-        logger.info(f"Elapsed Time: {elapsed:.2f} seconds")
+        logger.info("Status Code: %s", response.status_code)
+        logger.info("Elapsed Time: %.2f seconds", elapsed)
+
+        if streamed:
+            logger.info(
+                "Response Content Length: %s bytes (streamed)", response.headers.get("Content-Length", "unknown")
+            )
+            logger.info("=" * 50)
+            return
 
         content_type = response.headers.get("Content-Type", "")
         if "application/json" in content_type:
             try:
                 logger.info("Response JSON:")
-                logger.info(f"  {response.json()}")
+                logger.info("  %s", response.json())
             except ValueError:
                 logger.info("Response Text:")
-                logger.info(f"  {response.text[:1000]}...")
-        elif len(response.content) < 1000:
-            logger.info("Response Text:")
-            logger.info(f"  {response.text}")
+                logger.info("  %s...", response.text[:1000])
         else:
-            logger.info(f"Response Content Length: {len(response.content)} bytes")
+            # Size a non-JSON body from its declared length where there is one,
+            # so a large binary (an export zip) is never touched just to be
+            # reported as "too big to log".
+            declared = response.headers.get("Content-Length", "")
+            size = int(declared) if declared.isdigit() else len(response.content)
+            if size < 1000:
+                logger.info("Response Text:")
+                logger.info("  %s", response.text)
+            else:
+                logger.info("Response Content Length: %d bytes", size)
 
         logger.info("=" * 50)
 
-    def _resolve_auth(
-        self,
+    @staticmethod
+    def _resolve_credentials(
         *,
         auth: str | tuple | None,
         username: str | None,
         password: str | None,
         token: str | None,
-    ) -> BaseAuth:
-        """Pick the auth strategy from the (several) ways it can be supplied.
+    ) -> tuple[str, str, str | None]:
+        """Pick the auth form from the (several) ways it can be supplied.
 
         Preferred form is explicit keywords — ``username``/``password`` for
         credential auth, ``token`` (or ``api_key``) for API-key auth. As a
@@ -479,6 +649,15 @@ class FortiSOAR:
         key** — passing a single secret almost always means a key, not half of a
         login. The legacy positional ``auth`` (``str`` key or ``(user, pass)``
         tuple) is still accepted but deprecated.
+
+        Pure (no network, no side effects), so the constructor runs it first.
+
+        Returns:
+            tuple: ``("api_key", key, None)``, ``("lone_secret", key, None)`` or
+            ``("userpass", username, password)``.
+
+        Raises:
+            ValueError: If the credentials are missing, incomplete or conflicting.
         """
         # Legacy positional form — keep working, nudge toward keywords.
         if auth is not None:
@@ -502,27 +681,35 @@ class FortiSOAR:
         if token:
             if username:
                 raise ValueError("Provide either token/api_key or username/password, not both.")
-            if self.verbose:
-                logger.info("Using API key authentication")
-            return APIKeyAuth(self.base_url, token, self.verify_ssl)
+            return ("api_key", token, None)
 
         # Username + password → credential login.
         if username and password:
-            if self.verbose:
-                logger.info("Using username/password authentication")
-            return UserPasswordAuth(self.base_url, username, password, self.verify_ssl)
+            return ("userpass", username, password)
 
         # A lone secret with no username → treat it as an API key.
         if password and not username:
-            if self.verbose:
-                logger.info("No username given; treating the lone secret as an API key")
-            return APIKeyAuth(self.base_url, password, self.verify_ssl)
+            return ("lone_secret", password, None)
 
         if username and not password:
             raise ValueError("username was given without a password.")
 
         raise ValueError("No authentication provided — pass token=<api-key> or username=<user>, password=<pass>.")
 
+    def _resolve_auth(self, credentials: tuple[str, str, str | None], *, validate_api_key: bool = True) -> BaseAuth:
+        """Build the auth strategy for credentials from :meth:`_resolve_credentials`."""
+        kind, secret, password = credentials
+        if kind == "userpass":
+            if self.verbose:
+                logger.info("Using username/password authentication")
+            return UserPasswordAuth(self.base_url, secret, password, self.verify_ssl, session=self.session)
+        if self.verbose:
+            if kind == "lone_secret":
+                logger.info("No username given; treating the lone secret as an API key")
+            else:
+                logger.info("Using API key authentication")
+        return APIKeyAuth(self.base_url, secret, self.verify_ssl, validate=validate_api_key, session=self.session)
+
     @classmethod
     def from_config_file(cls, path: str, **overrides: Any) -> "FortiSOAR":
         """Build a client from a TOML config file (the ``[fortisoar]`` layout).
@@ -601,32 +788,17 @@ class FortiSOAR:
                 authentication method
             APIError: For other API errors
         """
+        endpoint, is_auth = _normalize_endpoint(endpoint)
         # Check operation support based on endpoint
-        if endpoint.startswith("/api/auth/"):
+        if is_auth:
             self.auth.check_operation_supported(BaseAuth.OPERATION_AUTH)
 
-        # Ensure endpoint starts with /
-        if not endpoint.startswith("/"):
-            endpoint = f"/{endpoint}"
-
-        # Add API version prefix if not present. A handful of fsr-ai routes
-        # (connector-backed MCP server wiring) live at the appliance root
-        # rather than under /api/3 — e.g. POST /mcp/config/export,
-        # /mcp/add/tools, /mcp/tools/{uuid}, /mcp/servers/connector — so are
-        # excluded from the default prefixing, same as /auth/ and /api/public/.
-        # The rule-engine app (delivery rules / channels) is served from its own
-        # /rule/api/ root, likewise outside /api/3.
-        if not endpoint.startswith(("/api/3/", "/auth/", "/api/public/", "/api/", "/mcp/", "/rule/")):
-            endpoint = f"/api/3{endpoint}"
-
-        url = urljoin(self.base_url, endpoint)
-
-        # Merge any additional headers
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        url = self._origin + endpoint
 
-        self._log_request(method, url, params, data, request_headers)
+        # Extra headers go through as-is: Session.request merges them over the
+        # session's own (auth, content type), so no per-request copy is needed.
+        if self.verbose:
+            self._log_request(method, url, params, data, headers)
 
         # Dry-run: never send mutating requests. Log the intent and hand back a
         # synthetic 200 so the caller's write path runs without touching the box.
@@ -639,8 +811,9 @@ class FortiSOAR:
         # Internal marker: set on the single auth-refresh replay so it can't leak
         # into session.request (which would TypeError) and bounds the retry to one.
         reauthed = kwargs.pop("_reauthed", False)
+        streamed = bool(kwargs.get("stream"))
 
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             response = self.session.request(
                 method=method.upper(),
@@ -649,10 +822,10 @@ class FortiSOAR:
                 json=data if files is None else None,
                 data=data if files is not None else None,
                 files=files,
-                headers=request_headers,
+                headers=headers,
                 **kwargs,
             )
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
 
             # HTTP trace: log request/response bodies if enabled
             if self.http_trace:
@@ -667,13 +840,14 @@ class FortiSOAR:
                     except (TypeError, ValueError):
                         print(f"  request body: {data}", file=sys.stderr)
                 print(f"  response: {response.status_code}", file=sys.stderr)
-                if response.content:
+                if not streamed and response.content:
                     try:
                         print(f"  response body: {response.json()}", file=sys.stderr)
                     except (TypeError, ValueError):
                         print(f"  response body: {response.text[:500]}", file=sys.stderr)
 
-            self._log_response(response, elapsed)
+            if self.verbose:
+                self._log_response(response, elapsed, streamed=streamed)
 
             # Recover from an expired session token: a long-lived client that
             # authenticated once at construction can outlive its token and start
@@ -687,18 +861,7 @@ class FortiSOAR:
                 and files is None
                 and getattr(self.auth, "can_refresh", False)
             ):
-                fresh = None
-                try:
-                    fresh = self.auth.refresh()
-                except Exception as exc:  # noqa: BLE001 — fall through to normal error handling
-                    # Log the actual refresh failure instead of discarding it: without
-                    # this, a broken refresh (network error, rotated creds, bug) was
-                    # invisible and only the original 401/403 ever surfaced, sending
-                    # callers debugging the wrong thing.
-                    logger.warning("auth refresh after %d failed: %s", response.status_code, exc)
-                    fresh = None
-                if fresh:
-                    self.session.headers.update(fresh)
+                if self._refresh_auth(response.status_code):
                     if logger.isEnabledFor(logging.INFO):
                         logger.info("auth token refreshed after %d; retrying request", response.status_code)
                     return self.request(
@@ -718,14 +881,46 @@ class FortiSOAR:
             return response
 
         except requests.exceptions.RequestException as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if hasattr(e, "response") and e.response is not None:
-                self._log_response(e.response, elapsed)
+                if self.verbose:
+                    self._log_response(e.response, elapsed)
                 handle_api_error(e.response)
             if self.verbose:
-                logger.error(f"Request failed: {str(e)}")  # pragma: no cover
+                logger.error("Request failed: %s", e)  # pragma: no cover
             raise
 
+    def _refresh_auth(self, status_code: int) -> bool:
+        """Re-authenticate and install the fresh headers on the session.
+
+        The new headers are built on a copy and swapped in with one assignment,
+        so a request starting on another thread (the ``map_threaded`` fan-outs
+        share this session) sees either the old or the new set, never a dict
+        mid-update.
+
+        Args:
+            status_code: The 401/403 that triggered the refresh, for the log line.
+
+        Returns:
+            bool: True when the auth produced fresh headers and the caller should
+            replay its request once.
+        """
+        try:
+            fresh = self.auth.refresh()
+        except Exception as exc:  # noqa: BLE001 — fall through to normal error handling
+            # Log the actual refresh failure instead of discarding it: without
+            # this, a broken refresh (network error, rotated creds, bug) was
+            # invisible and only the original 401/403 ever surfaced, sending
+            # callers debugging the wrong thing.
+            logger.warning("auth refresh after %d failed: %s", status_code, exc)
+            return False
+        if not fresh:
+            return False
+        headers = self.session.headers.copy()
+        headers.update(fresh)
+        self.session.headers = headers
+        return True
+
     @staticmethod
     def _safe_json(response: requests.Response) -> Any:
         """``response.json()`` that raises :class:`ResponseParseError` on a bad body.
@@ -735,7 +930,15 @@ class FortiSOAR:
         surface as a bare ``json.JSONDecodeError`` from deep inside this module.
         That error looked like a client bug, not what it actually is — the
         response never carried the JSON the caller expected.
+
+        Decodes with ``orjson`` when it is installed, falling back to
+        ``response.json()`` for anything it rejects.
         """
+        if _fast_json_loads is not None:
+            try:
+                return _fast_json_loads(response.content)
+            except ValueError:
+                pass  # e.g. a non-UTF-8 body: let requests detect the encoding
         try:
             return response.json()
         except ValueError:
@@ -812,15 +1015,11 @@ class FortiSOAR:
         response = self.request("GET", endpoint, params=params, raise_on_status=raise_on_status, **kwargs)
         if not raise_on_status:
             return response
-        content_type = response.headers.get("Content-Type", "")
-
-        if "application/json" in content_type:
-            return self._safe_json(response)
-        elif any(binary_type in content_type for binary_type in ["application/zip", "application/octet-stream"]):
+        media_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        if media_type in _BINARY_MEDIA_TYPES:
             return response.content
-        else:
-            # Default to JSON if content type is not explicitly specified
-            return self._safe_json(response)
+        # application/json, or no/unknown content type: default to JSON
+        return self._safe_json(response)
 
     @overload
     def post(
@@ -958,6 +1157,51 @@ class FortiSOAR:
         response = self.request("DELETE", endpoint, params=params, raise_on_status=raise_on_status, **kwargs)
         return response if not raise_on_status else None
 
+    def close(self) -> None:
+        """Close the client's pooled connections and stop verbose logging.
+
+        Closing the last verbose client in the process flushes queued log
+        records to the log file and stops the shared log writer. The client
+        should not be used afterwards.
+        """
+        listener = self._log_listener
+        if listener is not None:
+            self._log_listener = None
+            _release_verbose_logging(listener)
+        close_auth = getattr(self.auth, "close", None)
+        if close_auth is not None:
+            close_auth()
+        self.session.close()
+
+    # -- awaitable wrappers -------------------------------------------------
+    # pyfsr stays requests-based (see pyfsr._concurrency): these run the sync
+    # call on a worker thread so asyncio callers can ``asyncio.gather`` a
+    # fan-out over the same pooled session, auth refresh, retries and dry-run.
+
+    async def arequest(self, method: str, endpoint: str, *args: Any, **kwargs: Any) -> requests.Response:
+        """Awaitable :meth:`request`, run on a worker thread."""
+        return await asyncio.to_thread(self.request, method, endpoint, *args, **kwargs)
+
+    async def aget(self, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        """Awaitable :meth:`get`, run on a worker thread.
+
+        Example:
+            >>> alerts = await asyncio.gather(*(client.aget(f"/api/3/alerts/{i}") for i in ids))
+        """
+        return await asyncio.to_thread(self.get, endpoint, *args, **kwargs)
+
+    async def apost(self, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        """Awaitable :meth:`post`, run on a worker thread."""
+        return await asyncio.to_thread(self.post, endpoint, *args, **kwargs)
+
+    async def aput(self, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        """Awaitable :meth:`put`, run on a worker thread."""
+        return await asyncio.to_thread(self.put, endpoint, *args, **kwargs)
+
+    async def adelete(self, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+        """Awaitable :meth:`delete`, run on a worker thread."""
+        return await asyncio.to_thread(self.delete, endpoint, *args, **kwargs)
+
     def query(self, module: str, query_data: dict) -> dict[str, Any]:
         """
         Execute a query against a module
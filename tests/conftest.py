@@ -6,6 +6,18 @@ import requests
 from requests import Response
 
 
+@pytest.fixture(autouse=True)
+def _clear_auth_caches():
+    """Process-wide auth caches must not carry a validation/token across tests."""
+    from pyfsr.auth import api_key, user_pass
+
+    api_key._VALIDATED_KEYS.clear()
+    user_pass._TOKENS.clear()
+    yield
+    api_key._VALIDATED_KEYS.clear()
+    user_pass._TOKENS.clear()
+
+
 @pytest.fixture
 def mock_auth_response(mock_response):
     """Mock successful auth response"""
@@ -67,6 +79,42 @@ def mock_client(mock_response, monkeypatch):
     return client
 
 
+@pytest.fixture
+def session_request(mock_client, mocker):
+    """``requests.Session.request`` as a ``MagicMock``, for tests driving ``mock_client``.
+
+    Set ``.return_value`` (or ``.side_effect``) to the response the appliance
+    should give; read what was sent from ``.call_args.kwargs``.
+    """
+    from requests.sessions import Session
+
+    return mocker.patch.object(Session, "request")
+
+
+@pytest.fixture
+def routes(session_request, mock_response):
+    """Scripted appliance responses, keyed by URL fragment.
+
+    Map a path fragment (``"/api/3/appliances"``) to the response to serve, or
+    to an exception to raise; the first fragment found in the request URL wins
+    and anything unmatched gets a 404. What was sent is still on
+    ``session_request.call_args_list``.
+    """
+    table = {}
+
+    def dispatch(*args, **kwargs):
+        url = kwargs.get("url") or args[1]
+        for fragment, outcome in table.items():
+            if fragment in url:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                return outcome
+        return mock_response(status_code=404)
+
+    session_request.side_effect = dispatch
+    return table
+
+
 @pytest.fixture
 def mock_responses():
     """Load mock response data from JSON files."""
@@ -1,22 +1,53 @@
 """Shared fixtures for live integration tests (opt-in: pytest -m integration)."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+from pyfsr import FortiSOAR
+
 try:
     import tomllib  # Python 3.11+
 except ImportError:  # pragma: no cover
     import tomli as tomllib  # backport
 
 
+CONFIG_PATH = Path(__file__).parent.parent.parent / "examples" / "config.toml"
+
+
+@lru_cache(maxsize=1)
+def _read_config(path: Path) -> dict:
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_config():
-    """Load integration config from examples/config.toml, else skip."""
-    config_path = Path(__file__).parent.parent.parent / "examples" / "config.toml"
-    if not config_path.exists():
+    """Load integration config from examples/config.toml (parsed once), else skip."""
+    if not CONFIG_PATH.exists():
         pytest.skip("Integration test config not found (examples/config.toml)")
-    with open(config_path, "rb") as f:
-        return tomllib.load(f)
+    return _read_config(CONFIG_PATH)
+
+
+# Fixtures that need a live box; a test using none of them runs regardless.
+_LIVE_FIXTURES = frozenset({"client", "api_key_client", "user_pass_client", "integration_config"})
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live tests at collection time when no connection is configured.
+
+    Marks them once up front instead of letting each one build its fixtures
+    only to skip inside ``load_config``. Env vars count as configured, since
+    ``client`` can be built from ``FSR_*`` alone.
+    """
+    if CONFIG_PATH.exists() or os.environ.get("FSR_BASE_URL") or os.environ.get("FSR_HOST"):
+        return
+    here = Path(__file__).parent
+    skip = pytest.mark.skip(reason="No integration config (FSR_* env vars or examples/config.toml)")
+    for item in items:
+        if item.path.is_relative_to(here) and _LIVE_FIXTURES & set(item.fixturenames):
+            item.add_marker(skip)
 
 
 def get_auth_from_config(config):
@@ -40,10 +71,6 @@ def client():
       2. ``examples/config.toml`` (legacy).
     If neither is present, the integration suite is skipped.
     """
-    import os
-
-    from pyfsr import FortiSOAR
-
     if os.environ.get("FSR_BASE_URL") or os.environ.get("FSR_HOST"):
         from pyfsr.config import EnvConfig
 
@@ -56,3 +83,49 @@ def client():
         verify_ssl=config["fortisoar"].get("verify_ssl", True),
         suppress_insecure_warnings=True,
     )
+
+
+@pytest.fixture(scope="session")
+def integration_config():
+    """The parsed ``examples/config.toml`` (skips when absent)."""
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def api_key_client(integration_config):
+    """A live client that specifically uses API-key authentication.
+
+    Session-scoped like ``client``: one key validation and one pooled session
+    for the whole run, not one per module.
+    """
+    auth_config = integration_config["fortisoar"]["auth"]
+    if "api_key" not in auth_config:
+        pytest.skip("API key authentication not configured")
+
+    return FortiSOAR(
+        base_url=integration_config["fortisoar"]["base_url"],
+        token=auth_config["api_key"],
+        verify_ssl=integration_config["fortisoar"].get("verify_ssl", True),
+        suppress_insecure_warnings=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def user_pass_client(request, integration_config):
+    """A live client that specifically uses username/password authentication.
+
+    Session-scoped: one login for the whole run. Indirect parametrization may
+    pass ``verbose`` as ``request.param`` (default False).
+    """
+    auth_config = integration_config["fortisoar"]["auth"]
+    if "username" not in auth_config or "password" not in auth_config:
+        pytest.skip("Username/password authentication not configured")
+
+    return FortiSOAR(
+        base_url=integration_config["fortisoar"]["base_url"],
+        username=auth_config["username"],
+        password=auth_config["password"],
+        verify_ssl=integration_config["fortisoar"].get("verify_ssl", True),
+        suppress_insecure_warnings=True,
+        verbose=getattr(request, "param", False),
+    )
@@ -1,119 +1,16 @@
-import os
+import uuid
 from pathlib import Path
 
 import pytest
 
-from pyfsr.client import FortiSOAR
+from pyfsr import FortiSOAR
+from pyfsr._concurrency import map_threaded
 from pyfsr.exceptions import UnsupportedAuthOperationError
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Backport for older versions
 
-
-def load_config():
-    """Load test configuration from config file"""
-    config_path = Path(__file__).parent.parent.parent / "examples" / "config.toml"
-    if not config_path.exists():
-        pytest.skip("Integration test config not found")
-
-    with open(config_path, "rb") as f:
-        return tomllib.load(f)
-
-
-def get_auth_from_config(config):
-    """
-    Extract authentication details from config.
-    Supports both API key and username/password authentication.
-    """
-    auth_config = config["fortisoar"]["auth"]
-
-    # Check for API key first
-    if "api_key" in auth_config:
-        return auth_config["api_key"]
-
-    # Fall back to username/password
-    if "username" in auth_config and "password" in auth_config:
-        return (auth_config["username"], auth_config["password"])
-
-    raise ValueError("No valid authentication configuration found. Please provide either api_key or username/password.")
-
-
-@pytest.fixture(scope="module")
-def client():
-    """
-    Create FortiSOAR client for integration tests.
-    Supports both API key and username/password authentication.
-
-    Expected config.toml format:
-
-    [fortisoar]
-    base_url = "https://your-fortisoar-instance"
-    verify_ssl = true  # optional
-
-    [fortisoar.auth]
-    # Either:
-    api_key = "your-api-key"
-    # Or:
-    username = "your-username"
-    password = "your-password"
-    """
-    from pyfsr import FortiSOAR
-
-    config = load_config()
-    auth = get_auth_from_config(config)
-
-    return FortiSOAR(
-        base_url=config["fortisoar"]["base_url"],
-        auth=auth,
-        verify_ssl=config["fortisoar"].get("verify_ssl", True),
-        suppress_insecure_warnings=True,
-        verbose=True,
-    )
-
-
-@pytest.fixture(scope="module")
-def api_key_client():
-    """Fixture that specifically requires API key authentication"""
-    from pyfsr import FortiSOAR
-
-    config = load_config()
-    auth_config = config["fortisoar"]["auth"]
-
-    if "api_key" not in auth_config:
-        pytest.skip("API key authentication not configured")
-
-    return FortiSOAR(
-        base_url=config["fortisoar"]["base_url"],
-        auth=auth_config["api_key"],
-        verify_ssl=config["fortisoar"].get("verify_ssl", True),
-        suppress_insecure_warnings=True,
-        verbose=True,
-    )
-
-
-@pytest.fixture(scope="module")
-def user_pass_client(request) -> FortiSOAR:
-    """Fixture that specifically requires username/password authentication"""
-    from pyfsr import FortiSOAR
-
-    config = load_config()
-    auth_config = config["fortisoar"]["auth"]
-
-    if "username" not in auth_config or "password" not in auth_config:
-        pytest.skip("Username/password authentication not configured")
-
-    # Get verbose parameter from fixture request or default to False
-    verbose = request.param if hasattr(request, "param") else False
-
-    return FortiSOAR(
-        base_url=config["fortisoar"]["base_url"],
-        auth=(auth_config["username"], auth_config["password"]),
-        verify_ssl=config["fortisoar"].get("verify_ssl", True),
-        suppress_insecure_warnings=True,
-        verbose=verbose,
-    )
+def _parallel(*calls):
+    """Run independent read-only calls concurrently over the shared session."""
+    return map_threaded(lambda call: call(), calls, on_error="raise")
 
 
 @pytest.fixture
@@ -128,27 +25,40 @@ def non_existent_pack() -> str:
     return "Non-existent Pack 12345"
 
 
+# Large enough to hold every pack on a box, so term filtering can be done in
+# Python over one fetch instead of one server search per term.
+_ALL_PACKS_LIMIT = 1000
+
+
+@pytest.fixture(scope="session")
+def all_installed_packs(client) -> list:
+    """Every installed solution pack, fetched once per run."""
+    return client.content_hub.search_installed_packs(limit=_ALL_PACKS_LIMIT)
+
+
+@pytest.fixture(scope="session")
+def all_available_packs(client) -> list:
+    """Every available (uninstalled) solution pack, fetched once per run."""
+    return client.content_hub.search_available_packs(limit=_ALL_PACKS_LIMIT)
+
+
 @pytest.fixture
-def known_available_pack_name(client) -> str:
+def known_available_pack_name(all_available_packs) -> str:
     """Label of a pack that is actually available (uninstalled) on this box.
 
     The available list excludes already-installed packs, so an installed pack
     like "SOAR Framework" won't appear there. Discover one at runtime instead
     of hardcoding a name that may already be installed.
     """
-    available = client.content_hub.search_available_packs(limit=1)
-    if not available:
+    if not all_available_packs:
         pytest.skip("No available (uninstalled) solution packs on this box")
-    return available[0]["label"]
+    return all_available_packs[0]["label"]
 
 
 # test url missing https with invalid auth
-def test_invalid_auth():
+def test_invalid_auth(integration_config):
     """Test invalid authentication configuration"""
-    from pyfsr import FortiSOAR
-
-    config = load_config()
-    url = config["fortisoar"]["base_url"]
+    url = integration_config["fortisoar"]["base_url"]
     # strip https://
     url = url.replace("https://", "")
 
@@ -156,54 +66,71 @@ def test_invalid_auth():
         FortiSOAR(url, verify_ssl=False, auth=123)
 
 
+_HIGH_SEVERITY = "/api/3/picklists/58d0753f-f7e4-403b-953c-b0f521eab759"
+
+_AUTH_VARIANTS = [
+    pytest.param("api_key_client", id="api-key"),
+    pytest.param("user_pass_client", id="user-pass"),
+]
+
+
+@pytest.fixture(scope="session")
+def shared_alert(client):
+    """One alert for the whole run's read-only checks, deleted at teardown."""
+    alert = client.alerts.create(
+        # Unique per run, so concurrent runs never match each other's alert
+        name=f"Integration Test Alert - shared - {uuid.uuid4().hex[:8]}",
+        description="Test alert from integration tests",
+        severity=_HIGH_SEVERITY,
+    )
+    yield alert
+    client.alerts.delete(alert["@id"].split("/")[-1])
+
+
 @pytest.mark.integration
-@pytest.mark.parametrize(
-    "client_fixture",
-    [
-        pytest.param("api_key_client", id="api-key"),
-        pytest.param("user_pass_client", id="user-pass"),
-    ],
-)
-def test_alert_lifecycle(request, client_fixture, client):
-    """Test complete alert lifecycle with real API using both auth methods"""
-    # Get the appropriate client fixture
+@pytest.mark.parametrize("client_fixture", _AUTH_VARIANTS)
+def test_alert_reads(request, client_fixture, shared_alert):
+    """Get, list and query an alert through each auth method"""
     client = request.getfixturevalue(client_fixture)
-
-    # Create alert
-    alert_data = {
-        "name": f"Integration Test Alert - {client_fixture}",
-        "description": "Test alert from integration tests",
-        "severity": "/api/3/picklists/58d0753f-f7e4-403b-953c-b0f521eab759",  # High
+    alert_id = shared_alert["@id"].split("/")[-1]
+
+    retrieved_alert = client.alerts.get(alert_id)
+    assert retrieved_alert["name"] == shared_alert["name"]
+
+    # List alerts and query for ours: both read-only, so run them together
+    query_payload = {
+        "logic": "AND",
+        "filters": [
+            {"field": "name", "operator": "eq", "value": shared_alert["name"]},
+            {"field": "severity", "operator": "eq", "value": _HIGH_SEVERITY},
+            {"field": "uuid", "operator": "eq", "value": alert_id},
+        ],
     }
+    listed, queried = _parallel(
+        lambda: client.alerts.list({"name": shared_alert["name"]}),
+        lambda: client.query("alerts", query_payload),
+    )
+    assert any(a["@id"].endswith(alert_id) for a in listed.get("hydra:member", []))
+    assert all(a["@id"].endswith(alert_id) for a in queried.get("hydra:member", []))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("client_fixture", _AUTH_VARIANTS)
+def test_alert_create_update_delete(request, client_fixture):
+    """Write an alert's lifecycle through each auth method"""
+    client = request.getfixturevalue(client_fixture)
 
-    created_alert = client.alerts.create(**alert_data)
+    created_alert = client.alerts.create(
+        name=f"Integration Test Alert - {client_fixture} - {uuid.uuid4().hex[:8]}",
+        description="Test alert from integration tests",
+        severity=_HIGH_SEVERITY,
+    )
     alert_id = created_alert["@id"].split("/")[-1]
 
     try:
-        # Verify alert was created
-        retrieved_alert = client.alerts.get(alert_id)
-        assert retrieved_alert["name"] == alert_data["name"]
-
-        # Update alert
         update_data = {"description": "Updated test description"}
         updated_alert = client.alerts.update(alert_id, update_data)
         assert updated_alert["description"] == update_data["description"]
-
-        # List alerts and verify our test alert is present
-        alerts = client.alerts.list({"name": alert_data["name"]})
-        assert any(a["@id"].endswith(alert_id) for a in alerts.get("hydra:member", []))
-
-        query_payload = {
-            "logic": "AND",
-            "filters": [
-                {"field": "name", "operator": "eq", "value": alert_data["name"]},
-                {"field": "severity", "operator": "eq", "value": alert_data["severity"]},
-                {"field": "uuid", "operator": "eq", "value": alert_id},
-            ],
-        }
-        alerts = client.query("alerts", query_payload)
-        assert all(a["@id"].endswith(alert_id) for a in alerts.get("hydra:member", []))
-
     finally:
         # Cleanup - delete test alert
         client.alerts.delete(alert_id)
@@ -213,36 +140,34 @@ def test_alert_lifecycle(request, client_fixture, client):
             client.alerts.get(alert_id)
 
 
-@pytest.mark.integration
-def test_file_upload(client):
-    """Test file upload functionality"""
-    # Create test file
-    test_file = Path(__file__).parent.parent / "resources" / "sample_files" / "test.txt"
-    test_file.parent.mkdir(exist_ok=True)
-    test_file.write_text("Test content for file upload")
-
-    try:
-        # Upload file
-        result = client.files.upload(str(test_file))
-        assert result["@type"] == "File"
-        assert result["filename"] == test_file.name
+@pytest.fixture(scope="session")
+def sample_upload_file(tmp_path_factory) -> Path:
+    """A small text file to upload, written once per run under pytest's tmp dir."""
+    path = tmp_path_factory.mktemp("sample_files") / "test.txt"
+    path.write_text("Test content for file upload")
+    return path
 
-        # Create attachment using uploaded file
-        attachment_data = {
-            "name": "Test Attachment",
-            "description": "Test attachment from integration tests",
-            "file": result["@id"],
-        }
 
-        attachment = client.post("/api/3/attachments", data=attachment_data)
-        assert attachment["name"] == attachment_data["name"]
+@pytest.mark.integration
+def test_file_upload(client, sample_upload_file):
+    """Test file upload functionality"""
+    # Upload file
+    result = client.files.upload(str(sample_upload_file))
+    assert result["@type"] == "File"
+    assert result["filename"] == sample_upload_file.name
+
+    # Create attachment using uploaded file
+    attachment_data = {
+        "name": "Test Attachment",
+        "description": "Test attachment from integration tests",
+        "file": result["@id"],
+    }
 
-        # delete attachment
-        client.delete(attachment["@id"])
+    attachment = client.post("/api/3/attachments", data=attachment_data)
+    assert attachment["name"] == attachment_data["name"]
 
-    finally:
-        # Cleanup
-        test_file.unlink()
+    # delete attachment
+    client.delete(attachment["@id"])
 
 
 @pytest.mark.parametrize(
@@ -251,60 +176,48 @@ def test_file_upload(client):
         pytest.param("api_key_client", True, False, id="api-key"),
         pytest.param("user_pass_client", False, False, id="user-pass"),
     ],
-    indirect=["client_fixture"],
 )
 @pytest.mark.integration
-def test_export_config(request, client_fixture, should_raise, verbose):
+def test_export_config(request, client_fixture, should_raise, verbose, tmp_path):
     """Test configuration export functionality"""
     client = request.getfixturevalue(client_fixture)
-    output_path = "test_export.zip"
-
-    try:
-        client.export_config.create_simplified_template(
-            name="Integration Test Export",
-            modules=["alerts"],
-            picklists=["AlertStatus", "Severity"],
-            connectors=["Code Snippet"],
-            playbook_collections=["01 - Drafts"],
-        )
+    output_path = str(tmp_path / "test_export.zip")
+
+    client.export_config.create_simplified_template(
+        name="Integration Test Export",
+        modules=["alerts"],
+        picklists=["AlertStatus", "Severity"],
+        connectors=["Code Snippet"],
+        playbook_collections=["01 - Drafts"],
+    )
 
-        if should_raise:
-            with pytest.raises(UnsupportedAuthOperationError):
-                client.export_config.export_by_template_name(
-                    template_name="Integration Test Export", output_path=output_path
-                )
-        else:
-            exported_file = client.export_config.export_by_template_name(
+    if should_raise:
+        with pytest.raises(UnsupportedAuthOperationError):
+            client.export_config.export_by_template_name(
                 template_name="Integration Test Export", output_path=output_path
             )
-            assert Path(exported_file).exists()
-            assert Path(exported_file).suffix == ".zip"
-
-    finally:
-        if os.path.exists(output_path):
-            os.remove(output_path)
+    else:
+        exported_file = client.export_config.export_by_template_name(
+            template_name="Integration Test Export", output_path=output_path
+        )
+        assert Path(exported_file).exists()
+        assert Path(exported_file).suffix == ".zip"
 
 
 @pytest.mark.parametrize("client_fixture,should_raise", [("api_key_client", True), ("user_pass_client", False)])
 @pytest.mark.integration
-def test_export_pack(request, client_fixture, should_raise, client):
+def test_export_pack(request, client_fixture, should_raise, tmp_path):
     """Test solution pack export functionality"""
     client = request.getfixturevalue(client_fixture)
-    output_path = "test_export.zip"
+    output_path = str(tmp_path / "test_export.zip")
 
-    try:
-        if should_raise:
-            with pytest.raises(UnsupportedAuthOperationError):
-                client.solution_packs.export_pack("SOAR Framework", output_path)
-        else:
-            exported_file = client.solution_packs.export_pack("SOAR Framework", output_path)
-            assert Path(exported_file).exists()
-            assert Path(exported_file).suffix == ".zip"
-
-    finally:
-        if os.path.exists(output_path):
-            # os.remove(output_path)
-            pass
+    if should_raise:
+        with pytest.raises(UnsupportedAuthOperationError):
+            client.solution_packs.export_pack("SOAR Framework", output_path)
+    else:
+        exported_file = client.solution_packs.export_pack("SOAR Framework", output_path)
+        assert Path(exported_file).exists()
+        assert Path(exported_file).suffix == ".zip"
 
 
 @pytest.mark.integration
@@ -324,26 +237,28 @@ def test_find_installed_pack(client, known_pack_name, non_existent_pack):
 
 
 @pytest.mark.integration
-def test_search_installed_packs(client, known_pack_name):
+def test_search_installed_packs(client, all_installed_packs, known_pack_name):
     """Test searching for multiple installed solution packs"""
     # Test default search (all installed packs)
-    all_packs = client.content_hub.search_installed_packs()
+    all_packs = all_installed_packs
     assert isinstance(all_packs, list)
     assert len(all_packs) > 0
     assert all(isinstance(p, dict) for p in all_packs)
     assert all("name" in p for p in all_packs)
 
-    # Test searching with known term
-    matching_packs = client.content_hub.search_installed_packs(known_pack_name)
+    # Test searching with known term (filtered from the one fetch)
+    matching_packs = [p for p in all_packs if known_pack_name in (p.get("label") or "")]
     assert len(matching_packs) > 0
     assert any(p["label"] == known_pack_name for p in matching_packs)
 
+    # Server-side behaviours stay live; both are independent reads
+    search = client.content_hub.search_installed_packs
+    limited_packs, empty_results = _parallel(lambda: search(limit=1), lambda: search("zzzzzzz"))
+
     # Test limit parameter
-    limited_packs = client.content_hub.search_installed_packs(limit=1)
     assert len(limited_packs) == 1
 
     # Test empty search results
-    empty_results = client.content_hub.search_installed_packs("zzzzzzz")
     assert len(empty_results) == 0
 
 
@@ -369,26 +284,28 @@ def test_find_available_pack(client, known_available_pack_name, non_existent_pac
 
 
 @pytest.mark.integration
-def test_search_available_packs(client, known_available_pack_name):
+def test_search_available_packs(client, all_available_packs, known_available_pack_name):
     """Test searching for multiple available solution packs"""
     # Test default search (all available packs)
-    all_packs = client.content_hub.search_available_packs()
+    all_packs = all_available_packs
     assert isinstance(all_packs, list)
     assert len(all_packs) > 0
     assert all(isinstance(p, dict) for p in all_packs)
     assert all("name" in p for p in all_packs)
 
-    # Test searching with known term
-    matching_packs = client.content_hub.search_available_packs(known_available_pack_name)
+    # Test searching with known term (filtered from the one fetch)
+    matching_packs = [p for p in all_packs if known_available_pack_name in (p.get("label") or "")]
     assert len(matching_packs) > 0
     assert any(p["label"] == known_available_pack_name for p in matching_packs)
 
+    # Server-side behaviours stay live; both are independent reads
+    search = client.content_hub.search_available_packs
+    limited_packs, empty_results = _parallel(lambda: search(limit=1), lambda: search("zzzzzzz"))
+
     # Test limit parameter
-    limited_packs = client.content_hub.search_available_packs(limit=1)
     assert len(limited_packs) == 1
 
     # Test empty search results
-    empty_results = client.content_hub.search_available_packs("zzzzzzz")
     assert len(empty_results) == 0
 
 
@@ -109,3 +109,20 @@ def test_create_alert_with_picklist_values(mock_client, mock_response, monkeypat
     assert result["@type"] == "Alert"
     assert result["severity"]["@id"] == alert_data["severity"]
     assert result["status"]["@id"] == alert_data["status"]
+
+
+def test_get_many_alerts_preserves_order_and_isolates_failures(mock_client, mock_response, monkeypatch):
+    """get_many fans out one GET per id, keeps input order, and leaves None for a
+    failed fetch instead of dropping the rest of the batch."""
+
+    def request(self, method, url, **kwargs):
+        alert_id = url.rsplit("/", 1)[-1]
+        if alert_id == "missing":
+            return mock_response(status_code=404, json_data={"message": "Not Found"})
+        return mock_response(json_data={"@id": f"/api/3/alerts/{alert_id}", "name": alert_id})
+
+    monkeypatch.setattr("requests.Session.request", request)
+
+    result = mock_client.alerts.get_many(["a1", "missing", "a3"])
+
+    assert [r and r["name"] for r in result] == ["a1", None, "a3"]
@@ -1,11 +1,47 @@
 import pytest
 import requests
 
+from pyfsr.auth import api_key, user_pass
 from pyfsr.auth.api_key import APIKeyAuth
 from pyfsr.auth.base import BaseAuth
 from pyfsr.auth.user_pass import UserPasswordAuth
 from pyfsr.exceptions import APIError, UnsupportedAuthOperationError, ValidationError
 
+BASE_URL = "https://test.fortisoar.com"
+API_KEY = "test-key-123"
+_OK_PAYLOAD = {"status": "success"}
+_UNAUTH_PAYLOAD = {"error": "Invalid authentication"}
+
+
+@pytest.fixture
+def valid_api_key_auth():
+    """An APIKeyAuth for tests that aren't about construction-time validation.
+
+    Built with ``validate=False``: no probe to mock. Tests that then call
+    ``is_valid`` patch ``Session.head`` themselves.
+    """
+    auth = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY, validate=False)
+    yield auth
+    auth.close()
+
+
+@pytest.fixture
+def mocked_head_ok(mocker):
+    """``Session.head`` patched so the API-key probe succeeds (200)."""
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 200
+    mock_head.return_value.json.return_value = _OK_PAYLOAD
+    return mock_head
+
+
+@pytest.fixture
+def mocked_head_unauth(mocker):
+    """``Session.head`` patched so the API-key probe is rejected (401)."""
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 401
+    mock_head.return_value.json.return_value = _UNAUTH_PAYLOAD
+    return mock_head
+
 
 @pytest.mark.parametrize(
     "bad_url",
@@ -15,7 +51,7 @@ def test_api_key_rejects_malformed_base_url(bad_url):
     """A malformed base_url must fail fast with a clear ValidationError instead
     of surfacing later as a cryptic connection error deep inside requests."""
     with pytest.raises(ValidationError):
-        APIKeyAuth(base_url=bad_url, api_key="test-key-123")
+        APIKeyAuth(base_url=bad_url, api_key=API_KEY)
 
 
 @pytest.mark.parametrize(
@@ -27,50 +63,43 @@ def test_user_pass_rejects_malformed_base_url(bad_url):
         UserPasswordAuth(base_url=bad_url, username="test_user", password="test_pass")
 
 
-def test_api_key_initialization_success(mocker):
+def test_api_key_initialization_success(mocked_head_ok):
     """Test successful API key initialization"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
+    auth = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
 
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
-
-    assert auth.api_key == "test-key-123"
-    assert auth.base_url == "https://test.fortisoar.com"
+    assert auth.api_key == API_KEY
+    assert auth.base_url == BASE_URL
     assert auth.verify_ssl is True
 
 
-def test_api_key_strips_trailing_slash(mocker):
+def test_api_key_strips_trailing_slash(mocked_head_ok):
     """Test base URL trailing slash is stripped"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
+    auth = APIKeyAuth(base_url=f"{BASE_URL}/", api_key=API_KEY)
 
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com/", api_key="test-key-123")
+    assert auth.base_url == BASE_URL
 
-    assert auth.base_url == "https://test.fortisoar.com"
 
-
-def test_api_key_headers(mocker):
+def test_api_key_headers(mocked_head_ok, valid_api_key_auth):
     """Test API key authentication headers are correctly formatted"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
-
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
+    auth = valid_api_key_auth
 
     headers = auth.get_auth_headers()
-    assert headers == {"Authorization": "API-KEY test-key-123", "Content-Type": "application/json"}
+    assert headers == {"Authorization": f"API-KEY {API_KEY}", "Content-Type": "application/json"}
 
+    # callers get a copy: mutating it can't leak into later requests
+    headers["X-Extra"] = "1"
+    assert "X-Extra" not in auth.get_auth_headers()
+
+    auth.api_key = "rotated-key"
+    assert auth.get_auth_headers()["Authorization"] == "API-KEY rotated-key"
+    auth.is_valid(force=True)
+    assert mocked_head_ok.call_args.kwargs["headers"]["Authorization"] == "API-KEY rotated-key"
 
-def test_api_key_validation_failed_auth(mocker):
-    """Test API key validation with failed authentication"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 401
-    mock_get.return_value.json.return_value = {"error": "Invalid authentication"}
 
+def test_api_key_validation_failed_auth(mocked_head_unauth):
+    """Test API key validation with failed authentication"""
     with pytest.raises(APIError) as exc_info:
-        APIKeyAuth(base_url="https://test.fortisoar.com", api_key="invalid-key")
+        APIKeyAuth(base_url=BASE_URL, api_key="invalid-key")
 
     assert "Invalid API key - authentication failed" in str(exc_info.value)
 
@@ -78,58 +107,79 @@ def test_api_key_validation_failed_auth(mocker):
 def test_api_key_validation_accepts_403_restricted_key(mocker):
     """A 403 on the probe means the key authenticated but lacks People-read
     permission — a valid, least-privilege key. It must NOT raise."""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 403
-    mock_get.return_value.text = '{"type":"AccessDeniedException","message":"Access Denied."}'
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 403
+    mock_head.return_value.text = '{"type":"AccessDeniedException","message":"Access Denied."}'
 
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
-    assert auth.api_key == "test-key-123"
+    auth = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+    assert auth.api_key == API_KEY
 
 
 def test_api_key_validation_server_error(mocker):
     """Test API key validation with server error"""
-    mock_get = mocker.patch("requests.get")
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 500
+    mock_get = mocker.patch.object(requests.Session, "get")
     mock_get.return_value.status_code = 500
-    mock_get.return_value.json.return_value = {"error": "Internal server error"}
     mock_get.return_value.text = "Internal server error"
 
     with pytest.raises(APIError) as exc_info:
-        APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
+        APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
 
     assert "API key validation failed with status 500" in str(exc_info.value)
+    assert "Internal server error" in str(exc_info.value)
+
+
+def test_api_key_validation_falls_back_to_get_when_head_unsupported(mocker):
+    """An appliance that doesn't route HEAD (405) is re-probed with a one-row GET."""
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 405
+    mock_get = mocker.patch.object(requests.Session, "get")
+    mock_get.return_value.status_code = 200
+
+    APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+
+    mock_get.assert_called_once_with(
+        f"{BASE_URL}/api/3/people",
+        params={"$limit": 1, "$page": 1},
+        headers={"Authorization": f"API-KEY {API_KEY}", "Content-Type": "application/json"},
+    )
+
+
+def test_api_key_validation_trusts_head_401_without_get(mocker, mocked_head_unauth):
+    mock_get = mocker.patch.object(requests.Session, "get")
+
+    with pytest.raises(APIError, match="Invalid API key"):
+        APIKeyAuth(base_url=BASE_URL, api_key="invalid-key")
+    mock_get.assert_not_called()
 
 
 def test_api_key_validation_connection_error(mocker):
     """Test API key validation with connection error"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.side_effect = requests.exceptions.ConnectionError("Connection failed")
 
     with pytest.raises(APIError) as exc_info:
-        APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
+        APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
 
     assert "API key validation request failed" in str(exc_info.value)
 
 
-def test_api_key_ssl_verification(mocker):
+def test_api_key_ssl_verification(mocked_head_ok):
     """Test SSL verification settings are respected"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
-
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123", verify_ssl=False)
+    auth = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY, verify_ssl=False)
 
     assert auth.verify_ssl is False
-    # Verify the request was made with verify=False
-    mock_get.assert_called_with("https://test.fortisoar.com/api/3/people", headers=mocker.ANY, verify=False)
+    # The validation session carries verify=False for every probe
+    assert auth._session.verify is False
+    mocked_head_ok.assert_called_with(
+        f"{BASE_URL}/api/3/people", headers=auth.get_auth_headers(), allow_redirects=False
+    )
 
 
-def test_api_key_unsupported_operations(mocker):
+def test_api_key_unsupported_operations(valid_api_key_auth):
     """Test unsupported operations are properly restricted"""
-    mock_get = mocker.patch("requests.get")
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
-
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
+    auth = valid_api_key_auth
 
     # Check that auth operations are blocked
     with pytest.raises(UnsupportedAuthOperationError) as exc_info:
@@ -146,22 +196,106 @@ def test_api_key_unsupported_operations(mocker):
     auth.check_operation_supported(BaseAuth.OPERATION_SOLUTION_PACK)
 
 
-def test_api_key_is_valid_method(mocker):
+def test_api_key_is_valid_method(mocker, valid_api_key_auth):
     """Test is_valid() method for checking API key validity"""
-    mock_get = mocker.patch("requests.get")
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.side_effect = [
+        mocker.Mock(status_code=200, **{"json.return_value": _OK_PAYLOAD}),
+        mocker.Mock(status_code=401, **{"json.return_value": _UNAUTH_PAYLOAD}),
+    ]
+    auth = valid_api_key_auth
 
-    # First make key valid during initialization
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
+    assert auth.is_valid(force=True) is True  # valid key
+    assert auth.is_valid(force=True) is False  # rejected key
+    assert mock_head.call_count == 2
 
-    auth = APIKeyAuth(base_url="https://test.fortisoar.com", api_key="test-key-123")
 
-    # Test valid key
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = {"status": "success"}
+def test_api_key_is_valid_trusts_recent_validation(mocked_head_ok):
+    """A key validated within the TTL is reported valid without another probe;
+    once the TTL lapses (or after a failure) is_valid() asks the appliance again."""
+    mock_head = mocked_head_ok
+
+    auth = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+    assert mock_head.call_count == 1
+
     assert auth.is_valid() is True
+    assert mock_head.call_count == 1
 
-    # Test invalid key
-    mock_get.return_value.status_code = 401
-    mock_get.return_value.json.return_value = {"error": "Invalid authentication"}
+    # lapse both the instance's and the process-wide validation
+    auth._last_validated_at -= auth._validation_ttl
+    api_key._VALIDATED_KEYS.clear()
+    mock_head.return_value.status_code = 401
+    assert auth.is_valid() is False
     assert auth.is_valid() is False
+    assert mock_head.call_count == 3
+
+
+def test_api_key_validation_is_shared_across_instances(mocked_head_ok):
+    """A second client for the same key + appliance skips the probe; a
+    different appliance, or force=True, still asks."""
+    mock_head = mocked_head_ok
+
+    APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+    second = APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+    assert mock_head.call_count == 1
+    assert second.is_valid() is True
+    assert mock_head.call_count == 1
+
+    APIKeyAuth(base_url="https://other.fortisoar.com", api_key=API_KEY)
+    assert mock_head.call_count == 2
+
+    mock_head.return_value.status_code = 401
+    assert second.is_valid(force=True) is False
+    # the rejection evicts the shared entry, so the next client re-probes
+    with pytest.raises(APIError):
+        APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+
+
+def test_user_pass_token_is_shared_across_instances(mocker, mock_auth_response):
+    mock_post = mocker.patch.object(requests.Session, "post", return_value=mock_auth_response)
+
+    first = UserPasswordAuth(base_url=BASE_URL, username="u", password="p")
+    second = UserPasswordAuth(base_url=BASE_URL, username="u", password="p")
+    assert mock_post.call_count == 1
+    assert second.token == first.token == "mock-jwt-token-123"
+    assert user_pass._TOKENS.get(second._token_key()) == "mock-jwt-token-123"
+
+    # refresh always mints a new token
+    second.refresh()
+    assert mock_post.call_count == 2
+
+
+def test_auth_probes_go_over_a_passed_in_session(mocker, mock_auth_response):
+    """The client hands its own session to the auth strategy: the login reuses
+    it (without a stale bearer header) and close() leaves it open."""
+    session = requests.Session()
+    session.headers["Authorization"] = "Bearer expired"
+    mock_post = mocker.patch.object(session, "post", return_value=mock_auth_response)
+    mock_close = mocker.patch.object(session, "close")
+
+    auth = UserPasswordAuth(base_url=BASE_URL, username="u", password="p", session=session)
+    assert auth.token == "mock-jwt-token-123"
+    assert mock_post.call_args.kwargs["headers"] == {"Authorization": None}
+    auth.close()
+    mock_close.assert_not_called()
+
+
+def test_api_key_head_204_counts_as_valid(mocker):
+    mock_head = mocker.patch.object(requests.Session, "head")
+    mock_head.return_value.status_code = 204
+    mock_get = mocker.patch.object(requests.Session, "get")
+
+    APIKeyAuth(base_url=BASE_URL, api_key=API_KEY)
+    mock_get.assert_not_called()
+
+
+def test_user_pass_headers_follow_the_token(mocker, mock_auth_response):
+    mocker.patch.object(requests.Session, "post", return_value=mock_auth_response)
+    auth = UserPasswordAuth(base_url=BASE_URL, username="u", password="p")
+
+    headers = auth.get_auth_headers()
+    headers["X-Extra"] = "1"  # callers get a copy
+    assert auth.get_auth_headers() == {"Authorization": "Bearer mock-jwt-token-123", "Content-Type": "application/json"}
+
+    auth.token = "rotated"
+    assert auth.get_auth_headers()["Authorization"] == "Bearer rotated"
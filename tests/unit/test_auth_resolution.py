@@ -27,13 +27,9 @@ def mock_session(monkeypatch):
         def raise_for_status(self):
             return None
 
+    # Covers the auth strategies too: the key probe and the login both go over
+    # the client's Session.
     monkeypatch.setattr(Session, "request", lambda *a, **k: _Resp())
-    # Auth backends call module-level requests.get/post, not the session.
-    import pyfsr.auth.api_key as ak
-    import pyfsr.auth.user_pass as up
-
-    monkeypatch.setattr(ak.requests, "get", lambda *a, **k: _Resp())
-    monkeypatch.setattr(up.requests, "post", lambda *a, **k: _Resp())
 
 
 def _client(**kwargs):
@@ -84,3 +80,20 @@ def test_positional_and_keyword_conflict_raises(mock_session):
         warnings.simplefilter("ignore")
         with pytest.raises(ValueError):
             _client(auth="k", token="t")
+
+
+def test_validate_api_key_false_skips_the_probe(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Session, "request", lambda *a, **k: calls.append(a) or pytest.fail("probe sent"))
+    client = _client(token="k", validate_api_key=False)
+    assert isinstance(client.auth, APIKeyAuth)
+    assert calls == []
+
+
+def test_bad_auth_fails_before_any_setup(monkeypatch, tmp_path):
+    """Credential checks run first: no log directory, session or network."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Session, "__init__", lambda self: pytest.fail("session built for bad auth"))
+    with pytest.raises(ValueError, match="without a password"):
+        _client(username="u", verbose=True)
+    assert not (tmp_path / "logs").exists()
@@ -10,203 +10,148 @@ from pyfsr.exceptions import (
     ValidationError,
 )
 
+ALERTS_EP = "/api/3/alerts"
+_NOT_FOUND = {"message": "Not found"}
 
-def test_request_success(mock_client, mock_response, monkeypatch):
+
+def test_request_success(mock_client, mock_response, session_request):
     """Test successful request with JSON response"""
     expected_data = {"key": "value"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(json_data=expected_data)
-
-    # Mock the session request
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(json_data=expected_data)
 
     # Test GET request
-    response = mock_client.request("GET", "/api/3/alerts")
+    response = mock_client.request("GET", ALERTS_EP)
     assert response.json() == expected_data
 
 
-def test_request_binary_response(mock_client, mock_response, monkeypatch):
+def test_request_binary_response(mock_client, mock_response, session_request):
     """Test request returning binary data (like file downloads)"""
     binary_content = b"binary data"
-
-    def mock_request(*args, **kwargs):
-        response = mock_response()
-        response.headers["Content-Type"] = "application/octet-stream"
-        response._content = binary_content
-        return response
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    response = mock_response()
+    response.headers["Content-Type"] = "application/octet-stream"
+    response._content = binary_content
+    session_request.return_value = response
 
     response = mock_client.request("GET", "/api/export/file.zip")
     assert response.content == binary_content
 
 
-def test_request_validation_error(mock_client, mock_response, monkeypatch):
-    """Test handling of validation errors (400)"""
-    error_response = {"type": "ValidationException", "message": "Invalid alert data"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=400, json_data=error_response)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    with pytest.raises(ValidationError) as exc:
-        mock_client.request("POST", "/api/3/alerts", data={"invalid": "data"})
-    assert "Invalid alert data" in str(exc.value)
-
-
-def test_request_auth_error(mock_client, mock_response, monkeypatch):
-    """Test handling of authentication errors (401)"""
-    error_response = {"message": "Invalid API key"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=401, json_data=error_response)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    with pytest.raises(AuthenticationError) as exc:
-        mock_client.request("GET", "/api/3/alerts")
-    assert "Invalid API key" in str(exc.value)
-
-
-def test_request_permission_error(mock_client, mock_response, monkeypatch):
-    """Test handling of permission errors (403)"""
-    error_response = {"message": "Insufficient permissions"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=403, json_data=error_response)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    with pytest.raises(PermissionError) as exc:
-        mock_client.request("GET", "/api/3/alerts")
-    assert "Insufficient permissions" in str(exc.value)
-
-
-def test_request_not_found(mock_client, mock_response, monkeypatch):
-    """Test handling of not found errors (404)"""
-    error_response = {"message": "Alert not found"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404, json_data=error_response)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    with pytest.raises(ResourceNotFoundError) as exc:
-        mock_client.request("GET", "/api/3/alerts/non-existent")
-    assert "Alert not found" in str(exc.value)
-
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("application/json; charset=utf-8", {"ok": True}),
+        ("", {"ok": True}),
+        ("application/zip", b'{"ok": true}'),
+        ("Application/Octet-Stream; name=x.bin", b'{"ok": true}'),
+    ],
+)
+def test_get_dispatches_on_media_type(mock_client, mock_response, session_request, content_type, expected):
+    response = mock_response()
+    response.headers["Content-Type"] = content_type
+    response._content = b'{"ok": true}'
+    session_request.return_value = response
 
-def test_request_server_error(mock_client, mock_response, monkeypatch):
-    """Test handling of server errors (500)"""
-    error_response = {"message": "Internal server error"}
+    assert mock_client.get(ALERTS_EP) == expected
 
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=500, json_data=error_response)
 
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+@pytest.mark.parametrize(
+    "status, payload, exc_cls, method, endpoint",
+    [
+        (
+            400,
+            {"type": "ValidationException", "message": "Invalid alert data"},
+            ValidationError,
+            "POST",
+            ALERTS_EP,
+        ),
+        (401, {"message": "Invalid API key"}, AuthenticationError, "GET", ALERTS_EP),
+        (403, {"message": "Insufficient permissions"}, PermissionError, "GET", ALERTS_EP),
+        (404, {"message": "Alert not found"}, ResourceNotFoundError, "GET", "/api/3/alerts/non-existent"),
+        (500, {"message": "Internal server error"}, APIError, "GET", ALERTS_EP),
+    ],
+    ids=["400-validation", "401-auth", "403-permission", "404-not-found", "500-server"],
+)
+def test_request_error_status(mock_client, mock_response, session_request, status, payload, exc_cls, method, endpoint):
+    """Each error status maps to its typed exception, carrying the server's message"""
+    session_request.return_value = mock_response(status_code=status, json_data=payload)
 
-    with pytest.raises(APIError) as exc:
-        mock_client.request("GET", "/api/3/alerts")
-    assert "Internal server error" in str(exc.value)
+    data = {"invalid": "data"} if method == "POST" else None
+    with pytest.raises(exc_cls) as exc:
+        mock_client.request(method, endpoint, data=data)
+    assert payload["message"] in str(exc.value)
 
 
-def test_request_with_query_params(mock_client, mock_response, monkeypatch):
+def test_request_with_query_params(mock_client, mock_response, session_request):
     """Test request with query parameters"""
     expected_params = {"status": "Open", "$limit": 10}
+    session_request.return_value = mock_response(json_data={})
 
-    def mock_request(*args, **kwargs):
-        assert kwargs.get("params") == expected_params
-        return mock_response(json_data={})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    mock_client.request("GET", "/api/3/alerts", params=expected_params)
+    mock_client.request("GET", ALERTS_EP, params=expected_params)
+    assert session_request.call_args.kwargs["params"] == expected_params
 
 
-def test_request_with_files(mock_client, mock_response, monkeypatch):
+def test_request_with_files(mock_client, mock_response, session_request):
     """Test request with file upload"""
     files = {"file": ("test.txt", b"content", "text/plain")}
-
-    def mock_request(*args, **kwargs):
-        assert "files" in kwargs
-        assert kwargs["files"] == files
-        return mock_response(json_data={"@type": "File", "filename": "test.txt"})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(json_data={"@type": "File", "filename": "test.txt"})
 
     response = mock_client.request("POST", "/api/3/files", files=files)
+    assert session_request.call_args.kwargs["files"] == files
     assert response.json()["@type"] == "File"
 
 
-def test_request_with_custom_headers(mock_client, mock_response, monkeypatch):
+def test_request_with_custom_headers(mock_client, mock_response, session_request):
     """Test request with custom headers"""
     custom_headers = {"X-Custom": "test"}
+    session_request.return_value = mock_response()
 
-    def mock_request(*args, **kwargs):
-        headers = kwargs.get("headers", {})
-        assert "X-Custom" in headers
-        assert headers["X-Custom"] == "test"
-        return mock_response()
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
-    mock_client.request("GET", "/api/3/alerts", headers=custom_headers)
+    mock_client.request("GET", ALERTS_EP, headers=custom_headers)
+    assert session_request.call_args.kwargs["headers"]["X-Custom"] == "test"
 
 
-def test_request_network_error(mock_client, monkeypatch):
-    """Test handling of network connection errors"""
+def test_request_without_extra_headers_leaves_merge_to_session(mock_client, mock_response, session_request):
+    """No per-request copy of the session headers: requests merges them itself."""
+    session_request.return_value = mock_response()
 
-    def mock_request(*args, **kwargs):
-        raise requests.exceptions.ConnectionError("Network error")
+    mock_client.request("GET", ALERTS_EP)
+    assert session_request.call_args.kwargs["headers"] is None
 
-    monkeypatch.setattr(requests.Session, "request", mock_request)
 
-    with pytest.raises(requests.exceptions.ConnectionError):
-        mock_client.request("GET", "/api/3/alerts")
-
-
-def test_request_timeout(mock_client, monkeypatch):
-    """Test handling of request timeouts"""
-
-    def mock_request(*args, **kwargs):
-        raise requests.exceptions.Timeout("Request timed out")
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+@pytest.mark.parametrize(
+    "exc_cls, msg",
+    [
+        (requests.exceptions.ConnectionError, "Network error"),
+        (requests.exceptions.Timeout, "Request timed out"),
+    ],
+)
+def test_request_network_exceptions(mock_client, session_request, exc_cls, msg):
+    """Transport errors (connection failures, timeouts) propagate unchanged"""
+    session_request.side_effect = exc_cls(msg)
 
-    with pytest.raises(requests.exceptions.Timeout):
-        mock_client.request("GET", "/api/3/alerts")
+    with pytest.raises(exc_cls, match=msg):
+        mock_client.request("GET", ALERTS_EP)
 
 
-def test_request_json_decode_error(mock_client, mock_response, monkeypatch):
+def test_request_json_decode_error(mock_client, mock_response, session_request):
     """Test handling of invalid JSON responses"""
-
-    def mock_request(*args, **kwargs):
-        response = mock_response()
-        response._content = b"Invalid JSON"
-        return response
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    response = mock_response()
+    response._content = b"Invalid JSON"
+    session_request.return_value = response
 
     with pytest.raises(ResponseParseError) as exc_info:
-        mock_client.get("/api/3/alerts")
+        mock_client.get(ALERTS_EP)
     assert "not valid JSON" in str(exc_info.value)
     assert exc_info.value.status_code == 200
 
 
-def test_request_exception_logging(mock_client, mock_response, monkeypatch):
+def test_request_exception_logging(mock_client, mock_response, session_request):
     """Test logging when RequestException is raised both with and without response"""
 
     # Case 1: RequestException with response
     error_response = mock_response(status_code=500, json_data={"message": "Server Error"})
     error_with_response = requests.exceptions.RequestException("Test error")
     error_with_response.response = error_response
-
-    def mock_request_with_response(*args, **kwargs):
-        raise error_with_response
-
-    monkeypatch.setattr(requests.Session, "request", mock_request_with_response)
+    session_request.side_effect = error_with_response
 
     # Enable verbose mode for logging
     mock_client.verbose = True
@@ -229,7 +174,7 @@ def test_request_reauths_and_retries_on_expired_token(mock_client, mock_response
         return mock_response(json_data={"ok": True})
 
     monkeypatch.setattr(_rq.sessions.Session, "request", mock_request)
-    resp = mock_client.request("GET", "/api/3/alerts")
+    resp = mock_client.request("GET", ALERTS_EP)
     assert resp.json() == {"ok": True}
     assert state["data_calls"] == 2  # original + one replay
     assert state["auth_calls"] >= 1  # refreshed at least once
@@ -254,7 +199,7 @@ def test_request_reauth_failure_is_logged_not_swallowed(mock_client, mock_respon
     monkeypatch.setattr(mock_client.auth, "refresh", broken_refresh)
 
     with caplog.at_level(_logging.WARNING, logger="pyfsr"):
-        mock_client.request("GET", "/api/3/alerts", raise_on_status=False)
+        mock_client.request("GET", ALERTS_EP, raise_on_status=False)
 
     assert any("refresh backend unreachable" in r.message for r in caplog.records)
 
@@ -273,69 +218,50 @@ def test_request_reauth_fires_only_once(mock_client, mock_response, monkeypatch)
 
     monkeypatch.setattr(_rq.sessions.Session, "request", mock_request)
     with pytest.raises(PermissionError):
-        mock_client.request("GET", "/api/3/alerts")
+        mock_client.request("GET", ALERTS_EP)
     assert state["data_calls"] == 2  # original + exactly one replay, then raise
 
 
 # -- raise_on_status (fire-and-observe-status probes) -----------------------
-def test_request_raise_on_status_false_returns_raw_response(mock_client, mock_response, monkeypatch):
+def test_request_raise_on_status_false_returns_raw_response(mock_client, mock_response, session_request):
     """raise_on_status=False returns the raw Response on a 4xx instead of raising."""
     error = {"message": "Not found"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404, json_data=error)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(status_code=404, json_data=error)
     resp = mock_client.request("GET", "/api/3/alerts/missing", raise_on_status=False)
     assert resp.status_code == 404
     assert resp.json() == error
 
 
-def test_get_raise_on_status_false_returns_response_not_json(mock_client, mock_response, monkeypatch):
+def test_get_raise_on_status_false_returns_response_not_json(mock_client, mock_response, session_request):
     """client.get(raise_on_status=False) returns the raw Response (not parsed JSON)."""
     error = {"message": "Forbidden"}
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=403, json_data=error)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-    resp = mock_client.get("/api/3/alerts", raise_on_status=False)
+    session_request.return_value = mock_response(status_code=403, json_data=error)
+    resp = mock_client.get(ALERTS_EP, raise_on_status=False)
     assert isinstance(resp, requests.Response)
     assert resp.status_code == 403
     assert resp.json() == error
 
 
-def test_post_and_delete_raise_on_status_false_return_response(mock_client, mock_response, monkeypatch):
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404, json_data={"message": "nope"})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-    post_resp = mock_client.post("/api/3/alerts", data={}, raise_on_status=False)
+def test_post_and_delete_raise_on_status_false_return_response(mock_client, mock_response, session_request):
+    session_request.return_value = mock_response(status_code=404, json_data={"message": "nope"})
+    post_resp = mock_client.post(ALERTS_EP, data={}, raise_on_status=False)
     assert isinstance(post_resp, requests.Response) and post_resp.status_code == 404
     del_resp = mock_client.delete("/api/3/alerts/x", raise_on_status=False)
     assert isinstance(del_resp, requests.Response) and del_resp.status_code == 404
 
 
-def test_raise_on_status_default_still_raises(mock_client, mock_response, monkeypatch):
+def test_raise_on_status_default_still_raises(mock_client, mock_response, session_request):
     """The default (raise_on_status=True) is unchanged — 4xx still raises."""
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404, json_data={"message": "Not found"})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(status_code=404, json_data=_NOT_FOUND)
     with pytest.raises(ResourceNotFoundError):
         mock_client.get("/api/3/alerts/missing")
 
 
-def test_raise_on_status_false_still_raises_on_network_error(mock_client, monkeypatch):
+def test_raise_on_status_false_still_raises_on_network_error(mock_client, session_request):
     """raise_on_status=False suppresses status errors but NOT transport errors."""
-
-    def mock_request(*args, **kwargs):
-        raise requests.exceptions.ConnectionError("Network error")
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.side_effect = requests.exceptions.ConnectionError("Network error")
     with pytest.raises(requests.exceptions.ConnectionError):
-        mock_client.get("/api/3/alerts", raise_on_status=False)
+        mock_client.get(ALERTS_EP, raise_on_status=False)
 
 
 def test_raise_on_status_false_preserved_through_reauth(mock_client, mock_response, monkeypatch):
@@ -354,7 +280,7 @@ def test_raise_on_status_false_preserved_through_reauth(mock_client, mock_respon
         return mock_response(json_data={"ok": True})
 
     monkeypatch.setattr(_rq.sessions.Session, "request", mock_request)
-    resp = mock_client.get("/api/3/alerts", raise_on_status=False)
+    resp = mock_client.get(ALERTS_EP, raise_on_status=False)
     assert isinstance(resp, requests.Response)
     assert resp.status_code == 200
     assert resp.json() == {"ok": True}
@@ -362,116 +288,70 @@ def test_raise_on_status_false_preserved_through_reauth(mock_client, mock_respon
 
 
 # -- version() fallback chain ------------------------------------------------
-def test_version_from_cyops_version_json(mock_client, mock_response, monkeypatch):
+def test_version_from_cyops_version_json(mock_client, mock_response, routes):
     """version() prefers /cyops_version.json on the configured base port."""
-
-    def mock_request(*args, **kwargs):
-        url = " ".join(str(a) for a in args) + " " + " ".join(str(v) for v in kwargs.values())
-        if "/cyops_version.json" in url:
-            return mock_response(json_data={"version": "7.6.5-5662"})
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/cyops_version.json"] = mock_response(json_data={"version": "7.6.5-5662"})
 
     assert mock_client.version() == "7.6.5-5662"
 
 
-def test_version_from_appliances_endpoint(mock_client, mock_response, monkeypatch):
+def test_version_from_appliances_endpoint(mock_client, mock_response, routes):
     """version() returns version string from /api/3/appliances."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(json_data={"@version": "7.4.2", "build": "123"})
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(json_data={"@version": "7.4.2", "build": "123"})
 
     version = mock_client.version()
     assert version == "7.4.2"
 
 
-def test_version_fallback_to_license_endpoint(mock_client, mock_response, monkeypatch):
+def test_version_fallback_to_license_endpoint(mock_client, mock_response, routes):
     """version() falls back to /api/auth/license when /api/3/appliances fails."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(status_code=404, json_data={"message": "Not found"})
-        if "/api/auth/license" in url:
-            return mock_response(json_data={"version": "7.3.1"})
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(status_code=404, json_data=_NOT_FOUND)
+    routes["/api/auth/license"] = mock_response(json_data={"version": "7.3.1"})
 
     version = mock_client.version()
     assert version == "7.3.1"
 
 
-def test_version_fallback_to_system_version_endpoint(mock_client, mock_response, monkeypatch):
+def test_version_fallback_to_system_version_endpoint(mock_client, mock_response, routes):
     """version() falls back to /api/version when appliances and license fail."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(status_code=404, json_data={"message": "Not found"})
-        if "/api/auth/license" in url:
-            return mock_response(status_code=404, json_data={"message": "Not found"})
-        if "/api/version" in url:
-            return mock_response(json_data={"version": "7.2.0"})
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(status_code=404, json_data=_NOT_FOUND)
+    routes["/api/auth/license"] = mock_response(status_code=404, json_data=_NOT_FOUND)
+    routes["/api/version"] = mock_response(json_data={"version": "7.2.0"})
 
     version = mock_client.version()
     assert version == "7.2.0"
 
 
-def test_version_returns_dict_when_multiple_fields(mock_client, mock_response, monkeypatch):
+def test_version_returns_dict_when_multiple_fields(mock_client, mock_response, routes):
     """version() returns dict with version + build when both are present."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(
-                json_data={
-                    "@version": "7.4.2",
-                    "build": "456",
-                    "@id": "/appliances/1",
-                }
-            )
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(
+        json_data={
+            "@version": "7.4.2",
+            "build": "456",
+            "@id": "/appliances/1",
+        }
+    )
 
     version = mock_client.version()
     # Should return the first non-@type, non-special key or the version string
     assert version == "7.4.2"
 
 
-def test_version_is_cached_across_calls(mock_client, mock_response, monkeypatch):
+def test_version_is_cached_across_calls(mock_client, mock_response, session_request):
     """version() only hits the network once; a second call reuses the cache."""
-    calls = {"n": 0}
-
-    def mock_request(*args, **kwargs):
-        calls["n"] += 1
-        return mock_response(json_data={"version": "8.0.0-6034"})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(json_data={"version": "8.0.0-6034"})
 
     assert mock_client.version() == "8.0.0-6034"
     assert mock_client.version() == "8.0.0-6034"
-    assert calls["n"] == 1
+    assert session_request.call_count == 1
 
 
-def test_version_refresh_bypasses_cache(mock_client, mock_response, monkeypatch):
+def test_version_refresh_bypasses_cache(mock_client, mock_response, session_request):
     """version(refresh=True) re-probes even when a cached value is present."""
-    responses = iter(["8.0.0-6034", "8.1.0-7000"])
-
-    def mock_request(*args, **kwargs):
-        return mock_response(json_data={"version": next(responses)})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.side_effect = [
+        mock_response(json_data={"version": "8.0.0-6034"}),
+        mock_response(json_data={"version": "8.1.0-7000"}),
+    ]
 
     assert mock_client.version() == "8.0.0-6034"
     assert mock_client.version(refresh=True) == "8.1.0-7000"
@@ -488,13 +368,8 @@ def test_version_refresh_bypasses_cache(mock_client, mock_response, monkeypatch)
         ("not-a-version", None),
     ],
 )
-def test_version_tuple_parses_shapes(mock_client, mock_response, monkeypatch, raw, expected):
-    def mock_request(*args, **kwargs):
-        if isinstance(raw, dict):
-            return mock_response(json_data=raw)
-        return mock_response(json_data={"version": raw})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+def test_version_tuple_parses_shapes(mock_client, mock_response, session_request, raw, expected):
+    session_request.return_value = mock_response(json_data=raw if isinstance(raw, dict) else {"version": raw})
 
     assert mock_client.version_tuple() == expected
 
@@ -509,37 +384,26 @@ def test_version_tuple_parses_shapes(mock_client, mock_response, monkeypatch, ra
         ("7.4.2", False),
     ],
 )
-def test_supports_native_mcp_gated_at_8_0_0(mock_client, mock_response, monkeypatch, version_str, expected):
+def test_supports_native_mcp_gated_at_8_0_0(mock_client, mock_response, session_request, version_str, expected):
     """The native MCP gateway (/mcp/*, client.mcp) shipped starting 8.0.0."""
-
-    def mock_request(*args, **kwargs):
-        return mock_response(json_data={"version": version_str})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(json_data={"version": version_str})
 
     assert mock_client.supports_native_mcp() is expected
 
 
-def test_supports_native_mcp_returns_none_when_unparseable(mock_client, mock_response, monkeypatch):
+def test_supports_native_mcp_returns_none_when_unparseable(mock_client, mock_response, session_request):
     """Unparseable/unavailable version -> None, not a guessed True/False."""
-
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(status_code=404)
 
     assert mock_client.version_tuple() is None
     assert mock_client.supports_native_mcp() is None
 
 
-def test_version_raises_when_all_endpoints_fail(mock_client, mock_response, monkeypatch):
+def test_version_raises_when_all_endpoints_fail(mock_client, mock_response, session_request):
     """version() raises FortiSOARException when all fallback endpoints fail."""
     from pyfsr.exceptions import FortiSOARException
 
-    def mock_request(*args, **kwargs):
-        return mock_response(status_code=404, json_data={"message": "Not found"})
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    session_request.return_value = mock_response(status_code=404, json_data=_NOT_FOUND)
 
     with pytest.raises(FortiSOARException) as exc:
         mock_client.version()
@@ -551,97 +415,58 @@ def test_version_raises_when_all_endpoints_fail(mock_client, mock_response, monk
     assert "/api/version" in error_msg
 
 
-def test_version_returns_appliances_dict_with_extra_fields(mock_client, mock_response, monkeypatch):
+def test_version_returns_appliances_dict_with_extra_fields(mock_client, mock_response, routes):
     """version() returns full dict from /api/3/appliances when fields present."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(
-                json_data={
-                    "@version": "7.5.0",
-                    "build": "789",
-                    "name": "FortiSOAR",
-                    "@id": "/appliances/1",
-                }
-            )
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(
+        json_data={
+            "@version": "7.5.0",
+            "build": "789",
+            "name": "FortiSOAR",
+            "@id": "/appliances/1",
+        }
+    )
 
     version = mock_client.version()
     # Should return the @version string since it exists
     assert version == "7.5.0"
 
 
-def test_version_returns_license_dict(mock_client, mock_response, monkeypatch):
+def test_version_returns_license_dict(mock_client, mock_response, routes):
     """version() returns dict from license endpoint if appliances fails."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            return mock_response(status_code=404, json_data={"message": "Not found"})
-        if "/api/auth/license" in url:
-            return mock_response(
-                json_data={
-                    "version": "7.3.1",
-                    "licensee": "Test Corp",
-                    "expiryDate": "2025-12-31",
-                }
-            )
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = mock_response(status_code=404, json_data=_NOT_FOUND)
+    routes["/api/auth/license"] = mock_response(
+        json_data={
+            "version": "7.3.1",
+            "licensee": "Test Corp",
+            "expiryDate": "2025-12-31",
+        }
+    )
 
     version = mock_client.version()
     assert version == "7.3.1"
 
 
-def test_version_with_network_error_falls_back(mock_client, mock_response, monkeypatch):
+def test_version_with_network_error_falls_back(mock_client, mock_response, routes):
     """version() tolerates exceptions and tries next endpoint."""
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            raise requests.exceptions.ConnectionError("Network error")
-        if "/api/auth/license" in url:
-            return mock_response(json_data={"version": "7.3.0"})
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
+    routes["/api/3/appliances"] = requests.exceptions.ConnectionError("Network error")
+    routes["/api/auth/license"] = mock_response(json_data={"version": "7.3.0"})
 
     version = mock_client.version()
     assert version == "7.3.0"
 
 
-def test_version_exhausts_all_fallbacks_then_raises(mock_client, mock_response, monkeypatch):
+def test_version_exhausts_all_fallbacks_then_raises(mock_client, routes, session_request):
     """version() tries all 3 endpoints before raising exception."""
     from pyfsr.exceptions import FortiSOARException
 
-    call_count = {"appliances": 0, "license": 0, "version": 0}
-
-    def mock_request(*args, **kwargs):
-        url = args[1] if len(args) > 1 else kwargs.get("url", "")
-        if "/api/3/appliances" in url:
-            call_count["appliances"] += 1
-            return mock_response(status_code=404)
-        if "/api/auth/license" in url:
-            call_count["license"] += 1
-            return mock_response(status_code=404)
-        if "/api/version" in url:
-            call_count["version"] += 1
-            return mock_response(status_code=404)
-        return mock_response(status_code=404)
-
-    monkeypatch.setattr(requests.Session, "request", mock_request)
-
+    # no routes scripted: every endpoint 404s
     with pytest.raises(FortiSOARException):
         mock_client.version()
 
     # All three endpoints should have been attempted
-    assert call_count["appliances"] >= 1
-    assert call_count["license"] >= 1
-    assert call_count["version"] >= 1
+    urls = [c.kwargs.get("url") or c.args[1] for c in session_request.call_args_list]
+    for fragment in ("/api/3/appliances", "/api/auth/license", "/api/version"):
+        assert any(fragment in url for url in urls)
 
 
 def test_retry_backoff_and_status_forcelist_are_configurable(mock_client):
@@ -667,3 +492,154 @@ def test_retry_defaults_unchanged(mock_client):
     retry = mock_client.session.get_adapter("https://test.fortisoar.com").max_retries
     assert retry.backoff_factor == 0.5
     assert retry.status_forcelist == (429, 500, 502, 503, 504)
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("alerts", (ALERTS_EP, False)),
+        (ALERTS_EP, (ALERTS_EP, False)),
+        ("/api/auth/users", ("/api/auth/users", True)),
+        ("/auth/authenticate", ("/auth/authenticate", False)),
+        ("/mcp/add/tools", ("/mcp/add/tools", False)),
+        ("/rule/api/rules", ("/rule/api/rules", False)),
+        ("/api/public/license", ("/api/public/license", False)),
+        ("/api/query/alerts", ("/api/query/alerts", False)),
+        ("/apiary", ("/api/3/apiary", False)),
+    ],
+)
+def test_normalize_endpoint(endpoint, expected):
+    from pyfsr.client import _normalize_endpoint
+
+    assert _normalize_endpoint(endpoint) == expected
+
+
+def test_safe_json_prefers_fast_decoder_and_falls_back(mock_response, monkeypatch):
+    import json
+
+    from pyfsr import client as client_mod
+
+    seen = []
+
+    def fast_loads(raw):
+        seen.append(raw)
+        if raw.startswith(b"\xef\xbb\xbf"):
+            raise ValueError("BOM")
+        return json.loads(raw)
+
+    monkeypatch.setattr(client_mod, "_fast_json_loads", fast_loads)
+    response = mock_response()
+    response._content = b'{"ok": true}'
+    assert client_mod.FortiSOAR._safe_json(response) == {"ok": True}
+    assert seen == [b'{"ok": true}']
+
+    # rejected by the fast path -> requests' own decoding
+    response = mock_response()
+    response._content = b'\xef\xbb\xbf{"ok": 1}'
+    assert client_mod.FortiSOAR._safe_json(response) == {"ok": 1}
+
+
+def test_async_wrappers_gather_over_the_sync_client(mock_client, mock_response, monkeypatch):
+    import asyncio
+
+    def mock_request(self, method, url, **kwargs):
+        return mock_response(json_data={"method": method, "url": url})
+
+    monkeypatch.setattr(requests.Session, "request", mock_request)
+
+    async def fan_out():
+        return await asyncio.gather(
+            mock_client.aget("/api/3/alerts/1"),
+            mock_client.apost(ALERTS_EP, data={"name": "x"}),
+            mock_client.arequest("GET", "alerts/2"),
+        )
+
+    got, posted, raw = asyncio.run(fan_out())
+    assert got == {"method": "GET", "url": "https://test.fortisoar.com/api/3/alerts/1"}
+    assert posted["method"] == "POST"
+    assert raw.json()["url"].endswith("/api/3/alerts/2")
+
+
+def test_verbose_logging_is_queued_and_flushed_on_close(mock_response, monkeypatch, tmp_path):
+    import logging
+
+    from pyfsr import FortiSOAR
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        requests.Session, "request", lambda self, method, url, **kw: mock_response(json_data={"token": "t"})
+    )
+    client = FortiSOAR(
+        base_url="https://test.fortisoar.com",
+        username="u",
+        password="p",
+        verbose=True,
+        suppress_insecure_warnings=True,
+    )
+    pyfsr_logger = logging.getLogger("pyfsr")
+    assert client._log_queue_handler in pyfsr_logger.handlers
+
+    client.get(ALERTS_EP)
+    client.close()
+
+    assert client._log_queue_handler not in pyfsr_logger.handlers
+    assert "URL: https://test.fortisoar.com/api/3/alerts" in (tmp_path / "logs" / "fortisoar.log").read_text()
+
+
+def test_verbose_clients_share_one_log_sink(mock_response, monkeypatch, tmp_path):
+    import logging
+    from logging.handlers import QueueHandler
+
+    from pyfsr import FortiSOAR
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        requests.Session, "request", lambda self, method, url, **kw: mock_response(json_data={"token": "t"})
+    )
+    first, second = (
+        FortiSOAR(
+            base_url="https://test.fortisoar.com",
+            username="u",
+            password="p",
+            verbose=True,
+            suppress_insecure_warnings=True,
+        )
+        for _ in range(2)
+    )
+    pyfsr_logger = logging.getLogger("pyfsr")
+    listener = first._log_listener
+    assert second._log_listener is listener
+    assert sum(isinstance(h, QueueHandler) for h in pyfsr_logger.handlers) == 1
+
+    first.get(ALERTS_EP)
+    first.close()
+    # the other verbose client still holds the sink
+    assert listener._thread is not None
+    second.close()
+    assert listener._thread is None
+    assert not any(isinstance(h, QueueHandler) for h in pyfsr_logger.handlers)
+    assert (tmp_path / "logs" / "fortisoar.log").read_text().count("URL: https://test.fortisoar.com/api/3/alerts") == 1
+
+
+def test_verbose_log_file_rotates_at_the_configured_size(mock_response, monkeypatch, tmp_path):
+    from logging.handlers import RotatingFileHandler
+
+    from pyfsr import FortiSOAR
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        requests.Session, "request", lambda self, method, url, **kw: mock_response(json_data={"token": "t"})
+    )
+    client = FortiSOAR(
+        base_url="https://test.fortisoar.com",
+        username="u",
+        password="p",
+        verbose=True,
+        suppress_insecure_warnings=True,
+    )
+    try:
+        (file_handler,) = [h for h in client._log_listener.handlers if isinstance(h, RotatingFileHandler)]
+        assert file_handler.maxBytes == client._max_log_size
+        assert file_handler.backupCount == client._backup_count
+    finally:
+        client.close()
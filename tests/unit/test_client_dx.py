@@ -70,12 +70,18 @@ def test_retry_disabled(mock_client):
         verify_ssl=False,
         max_retries=0,
     )
-    # With retries off we don't mount a custom adapter; requests' default
-    # adapter carries a no-retry policy.
+    # With retries off the mounted adapter carries a no-retry policy.
     retry = client.session.get_adapter("https://t.example.com").max_retries
     assert getattr(retry, "total", 0) in (0, None) or retry == 0
 
 
+def test_adapter_pool_sized_for_threaded_helpers(mock_client):
+    """The mounted adapter keeps more than requests' default 10 connections, so
+    thread-pooled helpers reuse keep-alive sockets instead of re-handshaking."""
+    adapter = mock_client.session.get_adapter("https://test.fortisoar.com")
+    assert adapter._pool_maxsize > 10
+
+
 # -- dry_run ----------------------------------------------------------------
 def _dry_run_client(mock_response, monkeypatch, sent):
     """Build a dry_run client, capturing every method that reaches the session."""
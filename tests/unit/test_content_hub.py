@@ -311,3 +311,46 @@ def test_get_installed_ai_agent_unknown_raises():
     api, _ = _api(_AGENTS)
     with pytest.raises(ValueError, match="AI agent 'Ghost' not found"):
         api.get_installed_ai_agent("Ghost")
+
+
+# ---------------------------------------------------------------------------
+# solution-pack search memo
+# ---------------------------------------------------------------------------
+
+
+def test_pack_search_is_memoized_on_request_until_cleared():
+    api, client = _api([{"name": "SOAR Framework", "type": "solutionpack"}])
+    for _ in range(3):
+        assert api.find_installed_pack("SOAR Framework", use_cache=True).name == "SOAR Framework"
+    assert len(client.calls) == 1
+
+    # a different (installed, term, limit) is its own entry
+    api.search_installed_packs("SOAR Framework", use_cache=True)
+    assert len(client.calls) == 2
+
+    api.clear_cache()
+    api.find_installed_pack("SOAR Framework", use_cache=True)
+    assert len(client.calls) == 3
+
+
+def test_plain_pack_searches_always_ask_the_appliance():
+    api, client = _api([{"name": "SOAR Framework", "type": "solutionpack"}])
+    api.find_installed_pack("SOAR Framework", use_cache=True)
+    api.find_installed_pack("SOAR Framework")
+    api.find_installed_pack("SOAR Framework")
+    assert len(client.calls) == 3
+
+
+def test_connector_searches_are_not_memoized():
+    api, client = _api([{"name": "code-snippet", "label": "Code Snippet", "type": "connector"}])
+    api.find_installed_connector("Code Snippet")
+    api.find_installed_connector("Code Snippet")
+    assert len(client.calls) == 2
+
+
+def test_search_term_travels_in_body_not_url():
+    api, client = _api([])
+    api.search_available_connectors("a&b#c", limit=5)
+    _, endpoint, body = client.calls[0]
+    assert endpoint == "/api/query/solutionpacks"
+    assert body["search"] == "a&b#c"
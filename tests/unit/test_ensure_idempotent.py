@@ -544,6 +544,9 @@ def test_solution_pack_ensure_installed_installs_when_absent(monkeypatch):
         def find_installed_pack(self, name):
             return None
 
+        def clear_cache(self):
+            pass
+
     api.content_hub = FakeContentHub()
 
     # Stub wait_for_install so we don't need import_job polling
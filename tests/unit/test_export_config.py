@@ -6,15 +6,20 @@ client (no live box). Lookup-heavy methods are stubbed where a box would be
 required.
 """
 
+import json
 from types import SimpleNamespace
 
 import pytest
+import requests
 
-from pyfsr import Query
+from pyfsr import FortiSOAR, Query
 from pyfsr.api.export_config import ExportConfigAPI, ExportTemplate
+from pyfsr.exceptions import FortiSOARException, ResponseParseError
 
 
 class FakeClient:
+    _safe_json = staticmethod(FortiSOAR._safe_json)
+
     def __init__(self, handler=None, version=(8, 0, 0)):
         self.calls = []
         self._handler = handler or (lambda *a, **k: {})
@@ -40,6 +45,24 @@ class FakeClient:
         self.calls.append(("DELETE", url, None))
         return self._handler("DELETE", url)
 
+    def request(self, method, url, params=None, headers=None, **kw):
+        """Raw-response path (streamed downloads, index reads): wrap the handler's
+        body, or pass through a ready-made ``requests.Response``."""
+        self.calls.append((method, url, params))
+        body = self._handler(method, url, params=params, headers=headers)
+        if isinstance(body, requests.Response):
+            return body
+        resp = requests.Response()
+        resp.status_code = 200
+        if isinstance(body, bytes):
+            resp.headers["Content-Type"] = "application/octet-stream"
+            resp._content = body
+        else:
+            resp.headers["Content-Type"] = "application/json"
+            resp._content = json.dumps(body).encode()
+        resp._content_consumed = True
+        return resp
+
 
 @pytest.fixture(autouse=True)
 def _no_sleep(monkeypatch):
@@ -104,8 +127,24 @@ def test_get_template_uuid_picks_most_recent_by_create_date():
     members = [
         {"name": "T", "@id": "/api/3/export_templates/old", "createDate": 100},
         {"name": "T", "@id": "/api/3/export_templates/new", "createDate": 200},
-        {"name": "Other", "@id": "/api/3/export_templates/x", "createDate": 300},
+        {"name": "T copy", "@id": "/api/3/export_templates/x", "createDate": 300},
+    ]
+
+    def handler(m, u, params=None, **k):
+        # newest-first is requested from the server (and re-checked locally)
+        assert params["$orderby"] == "-createDate"
+        return {"hydra:member": sorted(members, key=lambda r: r["createDate"], reverse=True)}
+
+    api, _ = _api(handler)
+    assert api._get_template_uuid("T") == "new"
+
+
+def test_get_template_uuid_ignores_server_order():
+    members = [
+        {"name": "T", "@id": "/api/3/export_templates/old", "createDate": 100},
+        {"name": "T", "@id": "/api/3/export_templates/new", "createDate": 200},
     ]
+    # an appliance that ignores ``$orderby`` and answers oldest-first
     api, _ = _api(lambda m, u, **k: {"hydra:member": members})
     assert api._get_template_uuid("T") == "new"
 
@@ -130,6 +169,116 @@ def test_get_picklist_iri_raises_when_missing():
         api._get_picklist_iri("Nope")
 
 
+def test_get_connector_info_searches_each_label_once():
+    row = {"name": "openai", "label": "OpenAI", "version": "2.0.0", "type": "connector"}
+    api, c = _api(lambda m, u, **k: {"hydra:member": [row]} if m == "POST" else {})
+    first = api._get_connector_info("OpenAI")
+    assert (
+        api._get_connector_info("OpenAI")
+        == first
+        == {
+            "value": "cyops-connector-openai-2.0.0",
+            "version": "2.0.0",
+            "label": "OpenAI",
+        }
+    )
+    assert sum(1 for m, _, _ in c.calls if m == "POST") == 1
+
+
+def test_lookups_are_cached_until_cleared():
+    def handler(m, u, **k):
+        if u == "/api/3/picklist_names":
+            return {"hydra:member": [{"@id": "/api/3/picklists/abc"}]}
+        if u == "/api/3/export_templates":
+            return {"hydra:member": [{"name": "T", "@id": "/api/3/export_templates/t-uuid"}]}
+        return {}
+
+    api, c = _api(handler)
+    for _ in range(3):
+        assert api._get_picklist_iri("Severity") == "/api/3/picklists/abc"
+        assert api._get_template_uuid("T") == "t-uuid"
+    assert len(c.calls) == 2
+
+    api.clear_cache()
+    api._get_picklist_iri("Severity")
+    assert len(c.calls) == 3
+
+
+def test_prime_caches_serves_lookups_without_requests():
+    api, c = _api(lambda m, u, **k: pytest.fail(f"unexpected {m} {u}"))
+    api.prime_caches(
+        picklists=[{"name": "Severity", "@id": "/api/3/picklist_names/sev"}, {"name": "no-iri"}],
+        connectors=[{"name": "code-snippet", "label": "Code Snippet", "version": "2.1.4"}],
+        playbook_collections=[{"name": "IR", "@id": "/api/3/workflow_collections/c-1"}],
+        templates=[{"name": "T", "@id": "/api/3/export_templates/t-1"}],
+    )
+    assert api._get_picklist_iri("Severity") == "/api/3/picklist_names/sev"
+    assert api._get_connector_info("Code Snippet")["value"] == "cyops-connector-code-snippet-2.1.4"
+    assert api._get_playbook_collection_info("IR") == {"label": "IR", "value": "c-1"}
+    assert api._get_template_uuid("T") == "t-1"
+    assert c.calls == []
+
+
+def test_creating_a_template_forgets_its_cached_uuid():
+    api, c = _api(lambda m, u, **k: {"hydra:member": [{"name": "T", "@id": "/api/3/export_templates/old"}]})
+    assert api._get_template_uuid("T") == "old"
+    api.create_export_template("T", options={})
+    api._get_template_uuid("T")
+    assert [m for m, _, _ in c.calls] == ["GET", "POST", "GET"]
+
+
+def test_export_template_writes_forget_cached_uuids():
+    api, c = _api(lambda m, u, **k: {"hydra:member": [{"name": "T", "@id": "/api/3/export_templates/new"}]})
+    c.export_config = api
+    for write in (
+        lambda: c.export_templates.create("T", options={}),
+        lambda: c.export_templates.update("t-1", options={}),
+        lambda: c.export_templates.delete("t-1"),
+    ):
+        api.prime_caches(templates=[{"name": "T", "uuid": "old"}])
+        write()
+        assert api._get_template_uuid("T") == "new"
+
+
+def test_export_by_template_name_relooks_up_a_stale_uuid(monkeypatch):
+    """A 404 from the trigger on a cached uuid re-resolves the name and retries once."""
+    from pyfsr.exceptions import ResourceNotFoundError
+
+    def handler(m, u, **k):
+        if m == "PUT" and "template=old" in u:
+            raise ResourceNotFoundError("Template not found")
+        if m == "PUT":
+            return {"jobUuid": "j1"}
+        return {"hydra:member": [{"name": "T", "@id": "/api/3/export_templates/new"}]}
+
+    api, c = _api(handler)
+    monkeypatch.setattr(api, "_poll_export_completion", lambda job, interval: {"file": {"@id": "/api/3/files/f"}})
+    monkeypatch.setattr(api, "_download_export", lambda iri, path: path)
+    api.prime_caches(templates=[{"name": "T", "uuid": "old"}])
+
+    assert api.export_by_template_name("T", output_path="t.zip") == "t.zip"
+    assert [u for m, u, _ in c.calls if m == "PUT"] == [
+        "/api/export?fileName=export_old.zip&template=old",
+        "/api/export?fileName=export_new.zip&template=new",
+    ]
+    assert api._template_cache.get("T") == "new"
+
+
+def test_lookup_cache_expires_and_evicts(monkeypatch):
+    from pyfsr import _cache
+
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    cache = _cache.TTLCache(maxsize=2, ttl=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert cache.get("a") is None  # evicted: oldest past maxsize
+    assert cache.get("c") == 3
+    now[0] += 10
+    assert cache.get("c") is None  # expired
+
+
 # ------------------------------------------------------------------ create_export_template
 
 
@@ -169,8 +318,46 @@ def test_create_simplified_template_builds_module_options():
     # untouched sections are still present as empty scaffolding
     assert opts["connectors"] == []
     assert opts["picklistNames"] == []
+    assert opts["rules"] == [] and opts["recordSets"] == []
+    assert opts["playbookBlocks"] == {"blocks": [], "includeGlobalVariables": True}
     assert captured["data"]["metadata"] == {"autoSelectPicklists": True}
 
+    # each template gets its own empty sections, never a shared list
+    first = opts
+    api.create_simplified_template(name="Second", modules=["alerts"])
+    assert captured["data"]["options"]["rules"] is not first["rules"]
+
+
+def test_create_simplified_template_resolves_lookups_in_input_order():
+    captured = {}
+
+    def handler(m, u, **k):
+        if m == "POST":
+            captured["data"] = k.get("data")
+            return {"@id": "/api/3/export_templates/t1"}
+        if u == "/api/3/picklist_names":
+            return {"hydra:member": [{"name": n, "@id": f"/api/3/picklists/{n}"} for n in "CBA"]}
+        if u == "/api/3/workflow_collections":
+            return {"hydra:member": [{"name": n, "@id": f"/api/3/workflow_collections/{n}-uuid"} for n in "YX"]}
+        return {}
+
+    api, _ = _api(handler)
+    api.create_simplified_template(
+        name="T",
+        picklists=["A", "B", "C"],
+        playbook_collections=["X", "Y"],
+    )
+    opts = captured["data"]["options"]
+    assert opts["picklistNames"] == ["/api/3/picklists/A", "/api/3/picklists/B", "/api/3/picklists/C"]
+    assert [c["value"] for c in opts["playbooks"]["collections"]] == ["X-uuid", "Y-uuid"]
+
+
+def test_create_simplified_template_unknown_name_raises():
+    api, c = _api(lambda m, u, **k: {"hydra:member": []})
+    with pytest.raises(ValueError, match="Picklist not found"):
+        api.create_simplified_template(name="T", picklists=["Nope"])
+    assert not any(m == "POST" for m, _, _ in c.calls)
+
 
 # ------------------------------------------------------------------- delete_template
 
@@ -190,7 +377,7 @@ def test_export_by_template_name_derives_filename(monkeypatch):
     monkeypatch.setattr(
         api,
         "_export_with_template",
-        lambda template_uuid, output_path, filename, poll_interval: (
+        lambda template_uuid, output_path, filename, poll_interval, template_name: (
             seen.update(uuid=template_uuid, filename=filename, output=output_path) or "out.zip"
         ),
     )
@@ -200,6 +387,14 @@ def test_export_by_template_name_derives_filename(monkeypatch):
     assert seen["output"] is None
 
 
+def test_export_by_template_name_sanitizes_separators(monkeypatch):
+    api, _ = _api(lambda m, u, **k: {"hydra:member": [{"name": "SOC: Q1/Q2 & more", "@id": "/x/u1"}]})
+    seen = {}
+    monkeypatch.setattr(api, "_export_with_template", lambda **kw: seen.update(kw) or "out.zip")
+    api.export_by_template_name("SOC: Q1/Q2 & more")
+    assert seen["filename"] == "soc__q1_q2___more.zip"
+
+
 # ------------------------------------------------------------------- export_connector
 
 
@@ -281,6 +476,47 @@ def test_export_with_template_polls_then_downloads(tmp_path):
     assert out.read_bytes() == b"ZIPBYTES"
 
 
+def test_poll_export_backs_off_between_checks(monkeypatch):
+    from pyfsr.api import export_config
+
+    statuses = iter(["Export In Progress"] * 4 + ["Export Complete"])
+    sleeps = []
+    monkeypatch.setattr(export_config.time, "sleep", sleeps.append)
+    api, c = _api(lambda m, u, **k: {"status": next(statuses)})
+    assert api._poll_export_completion("ejob-1", poll_interval=2).status == "Export Complete"
+    assert sleeps == [2, 3.0, 4.5, 6.75]
+    assert len(c.calls) == 5
+
+
+def test_poll_export_backoff_is_capped(monkeypatch):
+    from pyfsr.api import export_config
+
+    statuses = iter(["Export In Progress"] * 3 + ["Export Complete"])
+    sleeps = []
+    monkeypatch.setattr(export_config.time, "sleep", sleeps.append)
+    api, _ = _api(lambda m, u, **k: {"status": next(statuses)})
+    api._poll_export_completion("ejob-1", poll_interval=50)
+    assert sleeps == [50, 60.0, 60.0]
+
+
+@pytest.mark.parametrize("status", ["Export Failed", "Cancelled", "Error"])
+def test_poll_export_raises_on_terminal_failure(monkeypatch, status):
+    from pyfsr.api import export_config
+
+    monkeypatch.setattr(export_config.time, "sleep", lambda s: pytest.fail("slept on a failed job"))
+    api, _ = _api(lambda m, u, **k: {"status": status, "errorMessage": "disk full"})
+    with pytest.raises(FortiSOARException, match=f"{status}.*disk full"):
+        api._poll_export_completion("ejob-1", poll_interval=5)
+
+
+def test_download_export_refuses_json_metadata(tmp_path):
+    """Without the octet-stream body the files endpoint answers with JSON metadata;
+    that must fail loudly rather than be written out as the archive."""
+    api, _ = _api(lambda m, u, **k: {"@id": "/api/3/files/ef1", "filename": "x.zip"})
+    with pytest.raises(TypeError, match="Expected bytes response"):
+        api._download_export("/api/3/files/ef1", str(tmp_path / "x.zip"))
+
+
 # --------------------------------------------------------------- ExportTemplate builder
 
 
@@ -476,9 +712,11 @@ def test_export_template_needs_resolution_flag():
 
 
 def test_create_template_resolves_picklist_names():
+    index = [{"name": n, "@id": f"/api/3/picklists/{n}"} for n in ("AlertSeverity", "AlertStatus", "Other")]
+
     def handler(m, u, **k):
         if m == "GET" and u == "/api/3/picklist_names":
-            return {"hydra:member": [{"@id": f"/api/3/picklists/{k['params']['name']}"}]}
+            return {"hydra:member": index}
         return {"@id": "/api/3/export_templates/t1"}
 
     api, c = _api(handler)
@@ -486,6 +724,77 @@ def test_create_template_resolves_picklist_names():
     api.create_template(tmpl)
     opts = c.calls[-1][2]["options"]
     assert opts["picklistNames"] == ["/api/3/picklists/AlertStatus", "/api/3/picklists/AlertSeverity"]
+    # both names resolved from a single read of the picklist_names index
+    assert sum(1 for m, u, _ in c.calls if (m, u) == ("GET", "/api/3/picklist_names")) == 1
+
+
+def test_name_index_is_revalidated_by_etag():
+    sent = []
+
+    def handler(m, u, headers=None, **k):
+        sent.append((headers or {}).get("If-None-Match"))
+        resp = requests.Response()
+        resp.headers["ETag"] = '"v1"'
+        if sent[-1] == '"v1"':
+            resp.status_code = 304
+            resp._content = b""
+        else:
+            resp.status_code = 200
+            rows = [{"name": n, "@id": f"/api/3/picklists/{n}"} for n in "AB"]
+            resp._content = json.dumps({"hydra:member": rows}).encode()
+        return resp
+
+    api, _ = _api(handler)
+    assert api._get_picklist_iris(["A", "B"]) == ["/api/3/picklists/A", "/api/3/picklists/B"]
+    api._picklist_cache.clear()
+    # second read: conditional, answered 304, served from the kept rows
+    assert api._get_picklist_iris(["B", "A"]) == ["/api/3/picklists/B", "/api/3/picklists/A"]
+    assert sent == [None, '"v1"']
+
+
+def test_per_name_lookups_are_revalidated_by_etag():
+    sent = []
+
+    def handler(m, u, params=None, headers=None, **k):
+        sent.append((u, (headers or {}).get("If-None-Match")))
+        resp = requests.Response()
+        resp.headers["ETag"] = '"v1"'
+        if sent[-1][1] == '"v1"':
+            resp.status_code = 304
+            resp._content = b""
+        else:
+            resp.status_code = 200
+            row = {"name": params["name"], "@id": f"{u}/x", "uuid": "x"}
+            resp._content = json.dumps({"hydra:member": [row]}).encode()
+        return resp
+
+    api, _ = _api(handler)
+    for _ in range(2):
+        assert api._get_picklist_iri("Severity") == "/api/3/picklist_names/x"
+        assert api._get_playbook_collection_info("IR") == {"label": "IR", "value": "x"}
+        assert api._get_template_uuid("T") == "x"
+        # drop the name memos only: the next round must revalidate, not re-download
+        for cache in (api._picklist_cache, api._collection_cache, api._template_cache):
+            cache.clear()
+    assert [etag for _, etag in sent] == [None, None, None, '"v1"', '"v1"', '"v1"']
+
+
+def test_name_index_bad_body_raises_parse_error():
+    def handler(m, u, **k):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"<html>proxy error</html>"
+        return resp
+
+    api, _ = _api(handler)
+    with pytest.raises(ResponseParseError):
+        api._get_picklist_iris(["A", "B"])
+
+
+def test_get_picklist_iris_reports_every_missing_name():
+    api, _ = _api(lambda m, u, **k: {"hydra:member": [{"name": "A", "@id": "/api/3/picklists/A"}]})
+    with pytest.raises(ValueError, match="Picklist not found: B, C"):
+        api._get_picklist_iris(["A", "B", "C"])
 
 
 def test_create_template_resolves_view_templates():
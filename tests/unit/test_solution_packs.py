@@ -119,6 +119,18 @@ def test_install_wait(mock_client, mock_response, monkeypatch):
     assert result.progressPercent == 100
 
 
+def test_wait_for_install_clears_pack_search_memo_when_done(mock_client, mock_response, monkeypatch):
+    """A memoized search made while the import ran must not outlive it."""
+    statuses = iter([{"status": "Importing"}, {"status": "Import Complete"}])
+    monkeypatch.setattr("requests.Session.request", lambda *a, **k: mock_response(json_data=next(statuses)))
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    hub = mock_client.solution_packs.content_hub
+    hub._pack_search_cache.put((True, "SOAR Framework", 1), [])
+
+    mock_client.solution_packs.wait_for_install("job-uuid", interval=0)
+    assert len(hub._pack_search_cache) == 0
+
+
 def test_uninstall_success(mock_client, mock_response, monkeypatch):
     """uninstall() looks up the pack UUID and sends DELETE."""
     calls = []
@@ -134,13 +146,55 @@ def test_uninstall_success(mock_client, mock_response, monkeypatch):
         return mock_response(json_data={}, status_code=204)
 
     monkeypatch.setattr("requests.Session.request", fake_request)
+    mock_client.export_config.prime_caches(
+        templates=[{"name": "SOAR Framework", "uuid": "tmpl-uuid"}, {"name": "Nightly Backup", "uuid": "other-uuid"}]
+    )
     mock_client.solution_packs.uninstall("SOAR Framework")
+    # the pack's template goes with it; unrelated templates keep their uuids
+    cache = mock_client.export_config._template_cache
+    assert cache.get("SOAR Framework") is None
+    assert cache.get("Nightly Backup") == "other-uuid"
 
     delete_calls = [c for c in calls if c[0] == "DELETE"]
     assert len(delete_calls) == 1
     assert "pack-uuid" in delete_calls[0][1]
 
 
+def test_export_pack_leaves_template_cache_alone(mock_client, mock_response, monkeypatch):
+    """export_pack() exports by the pack's template uuid without caching it by name."""
+    template = {"uuid": "tmpl-uuid", "name": "SOAR Framework"}
+    pack = {"uuid": "pack-uuid", "name": "SOAR Framework", "version": "1.0.0", "template": template}
+    monkeypatch.setattr(
+        "requests.Session.request",
+        lambda *args, **kwargs: mock_response(json_data={"hydra:member": [pack]}),
+    )
+    api = mock_client.solution_packs
+    monkeypatch.setattr(api.export_config, "export_by_template_uuid", lambda **kw: kw["template_uuid"])
+
+    assert api.export_pack("SOAR Framework") == "tmpl-uuid"
+    assert len(api.export_config._template_cache) == 0
+    # one shared wrapper, so any cache it does hold is the client-level one
+    assert mock_client.export_config is api.export_config
+
+
+def test_repeat_export_pack_searches_once(mock_client, mock_response, monkeypatch, session_request):
+    """Exporting the same pack again within the memo's TTL reuses the search."""
+    pack = {"uuid": "pack-uuid", "name": "SOAR Framework", "version": "1.0.0", "template": {"uuid": "tmpl-uuid"}}
+    session_request.return_value = mock_response(json_data={"hydra:member": [pack]})
+    api = mock_client.solution_packs
+    monkeypatch.setattr(api.export_config, "export_by_template_uuid", lambda **kw: kw["template_uuid"])
+
+    api.export_pack("SOAR Framework")
+    api.export_pack("SOAR Framework")
+    searches = [c for c in session_request.call_args_list if c.kwargs["url"].endswith("/api/query/solutionpacks")]
+    assert len(searches) == 1
+
+    # ensure_installed always looks again
+    api.ensure_installed("SOAR Framework", "1.0.0")
+    searches = [c for c in session_request.call_args_list if c.kwargs["url"].endswith("/api/query/solutionpacks")]
+    assert len(searches) == 2
+
+
 def test_uninstall_not_found(mock_client, mock_response, monkeypatch):
     """uninstall() raises ValueError when the pack isn't installed."""
     monkeypatch.setattr(
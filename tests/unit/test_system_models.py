@@ -148,7 +148,7 @@ def test_solution_pack_fields():
 
 def test_content_hub_search_returns_models():
     members = {"hydra:member": [{"name": "openai", "label": "OpenAI", "type": "connector"}]}
-    client = FakeClient({"/api/query/solutionpacks?$limit=30&$page=1&$search=": members})
+    client = FakeClient({"/api/query/solutionpacks": members})
     ch = ContentHubSearch(client)
     out = ch.search_installed_connectors()
     assert len(out) == 1
@@ -159,11 +159,14 @@ def test_content_hub_search_returns_models():
 
 def test_content_hub_find_single_returns_model():
     members = {"hydra:member": [{"name": "stats", "label": "Stats", "type": "widget"}]}
-    client = FakeClient({"/api/query/solutionpacks?$limit=1&$page=1&$search=Stats": members})
+    client = FakeClient({"/api/query/solutionpacks": members})
     ch = ContentHubSearch(client)
     hit = ch.find_installed_widget("Stats")
     assert isinstance(hit, Widget)
     assert hit.label == "Stats"
+    _, _, params, body = client.calls[0]
+    assert params == {"$limit": 1, "$page": 1}
+    assert body["search"] == "Stats"
 
 
 def test_content_hub_featured_tags_are_typed():
@@ -178,7 +181,7 @@ def test_content_hub_featured_tags_are_typed():
             }
         ]
     }
-    client = FakeClient({"/api/query/solutionpacks?$limit=30&$page=1&$search=": members})
+    client = FakeClient({"/api/query/solutionpacks": members})
     out = ContentHubSearch(client).search_installed_connectors()
     tag = out[0].featuredTags[0]
     assert isinstance(tag, FeaturedTag)